@@ -3,17 +3,24 @@ AI-powered system optimization and task scheduling.
 """
 from pathlib import Path
 import json
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional
 import numpy as np
+import psutil
 from sklearn.ensemble import RandomForestRegressor
 
+# Number of recent samples that form the baseline for the anomaly score
+_ANOMALY_WINDOW = 60
+
 class AISystemOptimizer:
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.model_file = data_dir / "ai_model.joblib"
         self.history_file = data_dir / "optimization_history.json"
         self.model = RandomForestRegressor()
+        self._recent_samples = deque(maxlen=_ANOMALY_WINDOW)
+        self._last_stats: Optional[Dict] = None
         self.load_history()
 
     def load_history(self):
@@ -36,6 +43,37 @@ class AISystemOptimizer:
         })
         self.save_history()
 
+    def get_system_stats(self) -> Dict:
+        """Sample current resource usage, scored against the recent samples."""
+        sensors_battery = getattr(psutil, 'sensors_battery', None)
+        battery = sensors_battery() if sensors_battery is not None else None
+        stats = {
+            'cpu_percent': psutil.cpu_percent(),
+            'memory_percent': psutil.virtual_memory().percent,
+            'disk_percent': psutil.disk_usage('/').percent,
+            'battery_percent': battery.percent if battery is not None else None
+        }
+        stats['anomaly_score'] = self._anomaly_score(stats)
+        self._last_stats = stats
+        return stats
+
+    def _anomaly_score(self, stats: Dict) -> float:
+        """Score in [0, 1] for how far CPU and memory sit from their recent baseline."""
+        sample = (stats['cpu_percent'], stats['memory_percent'])
+        score = 0.0
+        if len(self._recent_samples) >= 2:
+            recent = np.array(self._recent_samples)
+            # +1 keeps a perfectly steady baseline from turning noise into a spike
+            deviation = np.abs(np.array(sample) - recent.mean(axis=0)) / (recent.std(axis=0) + 1.0)
+            score = float(min(1.0, deviation.max() / 3))
+        self._recent_samples.append(sample)
+        return score
+
+    def get_ai_suggestions(self) -> List[str]:
+        """Suggestions for the most recent sample, taking one if there is none yet."""
+        stats = self._last_stats if self._last_stats is not None else self.get_system_stats()
+        return self.get_optimization_suggestions(stats)
+
     def get_optimization_suggestions(self, current_stats: Dict) -> List[str]:
         suggestions = []
         
@@ -2,6 +2,7 @@
 File organization and management system.
 """
 from pathlib import Path
+import os
 import shutil
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -47,8 +48,26 @@ class FileOrganizer:
             self.history = []
 
     def save_history(self):
-        with open(self.history_file, 'w') as f:
-            json.dump(self.history, f, indent=4)
+        data = json.dumps(self.history, indent=4)
+        # Write beside the real file and swap it in so a crash never leaves it half-written
+        tmp_path = self.history_file.with_suffix(".json.tmp")
+        tmp_path.write_text(data)
+        os.replace(tmp_path, self.history_file)
+
+    def setup_folder_structure(self, root_dir: Optional[Path] = None) -> Dict[str, Path]:
+        """
+        Create one folder per configured category under root_dir
+        (data_dir / "organized" by default). Returns category -> folder.
+        """
+        if root_dir is None:
+            root_dir = self.data_dir / "organized"
+            
+        structure = {}
+        for category in self.config['categories']:
+            folder = root_dir / category
+            folder.mkdir(parents=True, exist_ok=True)
+            structure[category] = folder
+        return structure
 
     def organize_files(self, source_dir: Path, target_dir: Optional[Path] = None) -> Dict:
         """
@@ -87,6 +106,30 @@ class FileOrganizer:
                 return category
         return None
 
+    def categorize_file(self, file_path: Path) -> Optional[str]:
+        """Categorize a single file. Prefer categorize_files for more than one."""
+        return self.categorize_files([file_path])[file_path]
+
+    def categorize_files(self, paths: List[Path]) -> Dict[Path, Optional[str]]:
+        """
+        Categorize a batch of files by extension.
+        Read-only: nothing is moved, so nothing is recorded in the history.
+        """
+        # Extension -> category, first listed category wins as in _get_file_category
+        by_ext: Dict[str, str] = {}
+        for category, extensions in self.config['categories'].items():
+            for ext in extensions:
+                by_ext.setdefault(ext, category)
+                
+        return {file_path: by_ext.get(file_path.suffix.lower()) for file_path in paths}
+
+    def categorize_directory(self, dir_path: str) -> Dict[Path, Optional[str]]:
+        """Categorize every file under dir_path, recursively, as one batch."""
+        # os.walk is scandir-based and closes each directory handle before
+        # descending, so deep trees hold at most one descriptor open
+        paths = [Path(root, name) for root, _, files in os.walk(dir_path) for name in files]
+        return self.categorize_files(paths)
+
     def _get_organized_path(self, file_path: Path, target_dir: Path, category: str) -> Path:
         """Generate the new path for a file based on organization rules."""
         date_str = datetime.now().strftime('%Y-%m-%d')
@@ -2,9 +2,15 @@ import argparse
 from pathlib import Path
 from .smart_file_system import SmartFileSystem
 import json
+import os
 import sys
 
-def main():
+def main(argv=None):
+    # SFS_DB_URI overrides the default database, e.g. a shared in-memory
+    # SQLite URI ("file:name?mode=memory&cache=shared") for test runs
+    default_db = os.environ.get("SFS_DB_URI", "file_index.db")
+    db_help = f"Database file path (default: {default_db}; set SFS_DB_URI to change)"
+
     parser = argparse.ArgumentParser(
         description="Mindful Organizer - Smart File System CLI"
     )
@@ -15,24 +21,24 @@ def main():
     index_parser.add_argument("directory", help="Directory to index")
     index_parser.add_argument(
         "--db", 
-        default="file_index.db",
-        help="Database file path (default: file_index.db)"
+        default=default_db,
+        help=db_help
     )
 
     # Cluster command
     cluster_parser = subparsers.add_parser("cluster", help="Cluster indexed files")
     cluster_parser.add_argument(
         "--db", 
-        default="file_index.db",
-        help="Database file path (default: file_index.db)"
+        default=default_db,
+        help=db_help
     )
 
     # Report command
     report_parser = subparsers.add_parser("report", help="Generate cluster report")
     report_parser.add_argument(
         "--db", 
-        default="file_index.db",
-        help="Database file path (default: file_index.db)"
+        default=default_db,
+        help=db_help
     )
     report_parser.add_argument(
         "--output", 
@@ -51,8 +57,8 @@ def main():
     search_parser.add_argument("query", help="Search query text")
     search_parser.add_argument(
         "--db", 
-        default="file_index.db",
-        help="Database file path (default: file_index.db)"
+        default=default_db,
+        help=db_help
     )
     search_parser.add_argument(
         "--top-k", 
@@ -61,7 +67,7 @@ def main():
         help="Number of results to return (default: 5)"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     sfs = SmartFileSystem(db_path=args.db)
 
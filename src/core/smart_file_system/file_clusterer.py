@@ -25,7 +25,7 @@ class FileClusterer:
         # Get all embeddings from the indexer
         embeddings, file_paths = self._get_all_embeddings()
         
-        if not embeddings:
+        if embeddings is None:
             return {'status': 'error', 'message': 'No embeddings found'}
             
         # Reduce dimensionality for clustering
@@ -49,21 +49,22 @@ class FileClusterer:
         
     def _get_all_embeddings(self):
         """Retrieve all embeddings and corresponding file paths from indexer"""
-        with sqlite3.connect(self.file_indexer.db_path) as conn:
+        with self.file_indexer._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT path, embedding FROM files WHERE embedding IS NOT NULL')
+            cursor.execute('''
+                SELECT path, embedding, embedding_scale FROM files
+                WHERE embedding IS NOT NULL
+            ''')
             results = cursor.fetchall()
             
             if not results:
                 return None, None
                 
-            file_paths = []
-            embeddings = []
-            for path, embedding_blob in results:
-                file_paths.append(path)
-                embeddings.append(np.frombuffer(embedding_blob, dtype=np.float32))
-                
-            return np.array(embeddings), file_paths
+            # All embeddings share one dimension, so decode them as a single
+            # (n_files, dim) matrix instead of stacking per-row arrays
+            file_paths, blobs, scales = zip(*results)
+            embeddings = self.file_indexer.decode_embeddings(blobs, scales)
+            return embeddings, list(file_paths)
             
     def _reduce_dimensionality(self, embeddings: np.ndarray) -> np.ndarray:
         """Reduce embedding dimensionality for clustering"""
@@ -1,20 +1,48 @@
 import sqlite3
 from pathlib import Path
 import hashlib
-from typing import List, Dict, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from sentence_transformers import SentenceTransformer
 import numpy as np
 import json
 
+_TEXT_FILE_TYPES = frozenset(['.txt', '.md', '.py', '.js', '.html', '.css', '.json'])
+
+# Files read, embedded and written per step; bounds memory on large trees
+_INDEX_CHUNK_SIZE = 64
+
+# Stored in PRAGMA user_version; 1 = int8 embeddings with embedding_scale
+_SCHEMA_VERSION = 1
+
+_INSERT_FILE_SQL = '''
+    INSERT OR REPLACE INTO files 
+    (path, file_hash, last_modified, size, file_type, metadata,
+     embedding, embedding_scale)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 class FileIndexer:
     def __init__(self, db_path: str = "file_index.db"):
         self.db_path = db_path
         self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         self._init_db()
         
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, honouring SQLite URIs such as shared in-memory DBs"""
+        conn = sqlite3.connect(self.db_path, uri=self.db_path.startswith("file:"))
+        # WAL with synchronous=NORMAL syncs at checkpoints instead of on
+        # every commit, which is what bulk indexing spends its time on
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+        
     def _init_db(self):
         """Initialize the SQLite database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Create files table
@@ -27,54 +55,133 @@ class FileIndexer:
                     size INTEGER,
                     file_type TEXT,
                     metadata TEXT,
-                    embedding BLOB
+                    embedding BLOB,
+                    embedding_scale REAL
                 )
             ''')
             
             # Create indexes for faster queries
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_path ON files(path)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_file_type ON files(file_type)')
+            
+            # Migrations run once per database, not on every construction
+            version = cursor.execute('PRAGMA user_version').fetchone()[0]
+            if version < 1:
+                self._migrate_float_embeddings(cursor)
+            if version < _SCHEMA_VERSION:
+                cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
             conn.commit()
             
+    def _migrate_float_embeddings(self, cursor: sqlite3.Cursor):
+        """Quantize embeddings written as float32 by older versions"""
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(files)')}
+        if 'embedding_scale' not in columns:
+            cursor.execute('ALTER TABLE files ADD COLUMN embedding_scale REAL')
+            
+        cursor.execute('''
+            SELECT id, embedding FROM files
+            WHERE embedding IS NOT NULL AND embedding_scale IS NULL
+        ''')
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        matrix = np.frombuffer(b"".join(blob for _, blob in rows), dtype=np.float32)
+        quantized, scales = self._quantize_embeddings(matrix.reshape(len(rows), -1))
+        cursor.executemany(
+            'UPDATE files SET embedding = ?, embedding_scale = ? WHERE id = ?',
+            [(q.tobytes(), float(scale), row_id)
+             for q, scale, (row_id, _) in zip(quantized, scales, rows)])
+            
     def index_file(self, file_path: Path) -> bool:
         """Index a single file, storing its metadata and content embedding"""
+        return self.index_files([file_path]) == 1
+        
+    def index_files(self, file_paths: List[Path]) -> int:
+        """Index several files, returning how many were stored.
+        
+        Files go through in chunks of _INDEX_CHUNK_SIZE. Reading and hashing are
+        I/O-bound, so they overlap on a thread pool; each chunk's text contents
+        are then embedded in one batched encode call and written together.
+        """
+        stored = 0
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, len(file_paths), _INDEX_CHUNK_SIZE):
+                chunk = file_paths[start:start + _INDEX_CHUNK_SIZE]
+                scanned = [r for r in executor.map(self._scan_file, chunk) if r is not None]
+                if scanned:
+                    stored += self._store_scanned(scanned)
+        return stored
+        
+    def _store_scanned(self, scanned: List[Tuple]) -> int:
+        """Embed and store one chunk of scanned files, returning how many were stored"""
+        texts = [content for *_, content in scanned if content is not None]
+        embeddings = iter(())
+        if texts:
+            try:
+                embeddings = zip(*self._quantize_embeddings(self.embedding_model.encode(texts)))
+            except Exception as e:
+                # Skip only this chunk; the rest of the run carries on
+                print(f"Error embedding files {scanned[0][0]} .. {scanned[-1][0]}: {e}")
+                return 0
+        
+        rows = []
+        for file_path, file_hash, last_modified, size, file_type, content in scanned:
+            # Read and embed text content if it's a text file
+            embedding = scale = None
+            metadata = {}
+            if content is not None:
+                embedding, scale = next(embeddings)
+                metadata['content_length'] = len(content)
+                metadata['lines'] = content.count('\n') + 1
+            rows.append((
+                str(file_path),
+                file_hash,
+                last_modified,
+                size,
+                file_type,
+                json.dumps(metadata),
+                embedding.tobytes() if embedding is not None else None,
+                float(scale) if scale is not None else None
+            ))
+            
+        try:
+            # One write transaction for the whole batch
+            with self._connect() as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.executemany(_INSERT_FILE_SQL, rows)
+            return len(rows)
+        except Exception:
+            # The batch rolled back; retry row by row so only the bad files are skipped
+            return self._insert_rows_individually(rows)
+            
+    def _insert_rows_individually(self, rows: List[Tuple]) -> int:
+        """Insert rows one statement at a time, skipping any that fail"""
+        stored = 0
+        with self._connect() as conn:
+            for row in rows:
+                try:
+                    conn.execute(_INSERT_FILE_SQL, row)
+                    stored += 1
+                except Exception as e:
+                    print(f"Error indexing file {row[0]}: {e}")
+        return stored
+        
+    def _scan_file(self, file_path: Path) -> Optional[Tuple]:
+        """Hash, stat and (for text files) read one file; runs on the thread pool"""
         try:
             file_hash = self._calculate_file_hash(file_path)
-            last_modified = file_path.stat().st_mtime
-            size = file_path.stat().st_size
+            stat = file_path.stat()
             file_type = file_path.suffix.lower()
             
-            # Read and embed text content if it's a text file
-            embedding = None
-            metadata = {}
-            
-            if file_type in ['.txt', '.md', '.py', '.js', '.html', '.css', '.json']:
+            content = None
+            if file_type in _TEXT_FILE_TYPES:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
-                    embedding = self._generate_embedding(content)
-                    metadata['content_length'] = len(content)
-                    metadata['lines'] = content.count('\n') + 1
-            
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO files 
-                    (path, file_hash, last_modified, size, file_type, metadata, embedding)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    str(file_path),
-                    file_hash,
-                    last_modified,
-                    size,
-                    file_type,
-                    json.dumps(metadata),
-                    embedding.tobytes() if embedding is not None else None
-                ))
-                conn.commit()
-            return True
+            return file_path, file_hash, stat.st_mtime, stat.st_size, file_type, content
         except Exception as e:
             print(f"Error indexing file {file_path}: {e}")
-            return False
+            return None
             
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of file contents"""
@@ -88,42 +195,56 @@ class FileIndexer:
         """Generate embedding vector for text content"""
         return self.embedding_model.encode(text)
         
+    @staticmethod
+    def _quantize_embeddings(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Quantize float embeddings to int8 rows with one scale per row"""
+        scales = np.abs(embeddings).max(axis=1) / 127
+        scales[scales == 0] = 1.0
+        quantized = np.round(embeddings / scales[:, None]).astype(np.int8)
+        return quantized, scales
+        
+    @staticmethod
+    def decode_embeddings(blobs: List[bytes], scales: List[float]) -> np.ndarray:
+        """Decode stored int8 embedding blobs into an (n, dim) float32 matrix"""
+        quantized = np.frombuffer(b"".join(blobs), dtype=np.int8).reshape(len(blobs), -1)
+        return quantized.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+        
     def get_file_embedding(self, file_path: str) -> Optional[np.ndarray]:
         """Retrieve embedding for a file"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT embedding FROM files WHERE path = ?', (file_path,))
+            cursor.execute('SELECT embedding, embedding_scale FROM files WHERE path = ?',
+                           (file_path,))
             result = cursor.fetchone()
             if result and result[0]:
-                return np.frombuffer(result[0], dtype=np.float32)
+                return self.decode_embeddings([result[0]], [result[1]])[0]
         return None
         
     def search_similar_files(self, query: str, top_k: int = 5) -> List[Dict]:
         """Search for files similar to the query text"""
+        if top_k <= 0:
+            return []
         query_embedding = self._generate_embedding(query)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.create_function("cosine_sim", 2, self._cosine_similarity)
+        with self._connect() as conn:
             cursor = conn.cursor()
-            
             cursor.execute('''
-                SELECT path, cosine_sim(embedding, ?) as similarity 
-                FROM files 
+                SELECT path, embedding, embedding_scale FROM files
                 WHERE embedding IS NOT NULL
-                ORDER BY similarity DESC
-                LIMIT ?
-            ''', (query_embedding.tobytes(), top_k))
-            
-            results = []
-            for row in cursor.fetchall():
-                results.append({
-                    'path': row[0],
-                    'similarity': row[1]
-                })
-            return results
+            ''')
+            rows = cursor.fetchall()
+        if not rows:
+            return []
             
-    def _cosine_similarity(self, blob1: bytes, blob2: bytes) -> float:
-        """SQLite function to calculate cosine similarity between embeddings"""
-        vec1 = np.frombuffer(blob1, dtype=np.float32)
-        vec2 = np.frombuffer(blob2, dtype=np.float32)
-        return float(np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2)))
+        # Decode every stored vector as one (n_files, dim) matrix and score
+        # them all with a single matrix-vector product
+        paths, blobs, scales = zip(*rows)
+        matrix = self.decode_embeddings(blobs, scales)
+        similarities = (matrix @ query_embedding) / (
+            np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_embedding))
+        
+        # Select the top k without sorting the whole corpus
+        k = min(top_k, len(rows))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [{'path': paths[i], 'similarity': float(similarities[i])} for i in top]
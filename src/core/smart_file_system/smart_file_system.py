@@ -4,6 +4,7 @@ from .file_indexer import FileIndexer
 from .file_clusterer import FileClusterer
 from .hardware_optimizer import HardwareOptimizer
 from .output_generator import OutputGenerator
+import os
 import time
 import logging
 
@@ -31,11 +32,10 @@ class SmartFileSystem:
         if not path.exists():
             raise FileNotFoundError(f"Directory not found: {directory_path}")
             
-        file_count = 0
-        for file_path in path.rglob('*'):
-            if file_path.is_file():
-                if self.file_indexer.index_file(file_path):
-                    file_count += 1
+        # os.walk is scandir-based and skips unreadable subdirectories, as rglob did
+        file_paths = [Path(root, name) for root, _, files in os.walk(path) for name in files]
+        
+        file_count = self.file_indexer.index_files(file_paths)
                     
         return {
             'status': 'success',
@@ -2,11 +2,12 @@
 Task management system for organizing and prioritizing tasks.
 """
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pathlib import Path
 import json
+import uuid
 
 class TaskPriority(Enum):
     Low = 1
@@ -34,12 +35,14 @@ class Task:
     notes: Optional[str] = None
     created_at: datetime = datetime.now()
     completed_at: Optional[datetime] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
 
 class TaskManager:
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.tasks_file = data_dir / "tasks.json"
         self.tasks: List[Task] = []
+        self._tasks_by_id: Dict[str, Task] = {}
         self._load_tasks()
 
     def _load_tasks(self):
@@ -47,6 +50,7 @@ class TaskManager:
             with open(self.tasks_file, 'r') as f:
                 tasks_data = json.load(f)
                 self.tasks = [Task(**task) for task in tasks_data]
+                self._tasks_by_id = {task.id: task for task in self.tasks}
 
     def _save_tasks(self):
         with open(self.tasks_file, 'w') as f:
@@ -54,6 +58,7 @@ class TaskManager:
 
     def add_task(self, task: Task):
         self.tasks.append(task)
+        self._tasks_by_id[task.id] = task
         self._save_tasks()
 
     def complete_task(self, task: Task):
@@ -61,6 +66,13 @@ class TaskManager:
         task.completed_at = datetime.now()
         self._save_tasks()
 
+    def complete_task_by_id(self, task_id: str) -> bool:
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        self.complete_task(task)
+        return True
+
     def get_tasks(self, completed: bool = False) -> List[Task]:
         return [task for task in self.tasks if task.completed == completed]
 
@@ -3,14 +3,35 @@ File organization strategies adapted for different mental health needs.
 """
 from enum import Enum, auto
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import errno
+import os
 import shutil
 import json
 import re
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+SHARED_METADATA_FILE = ".org_shared.json"
+_REFERENCE_SUFFIXES = frozenset({'.pdf', '.doc', '.docx', '.txt', '.md'})
+
+def _dump_json(data) -> bytes:
+    """Encode data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
 class MentalHealthProfile:
     """Represents different mental health considerations for file organization."""
+    __slots__ = ('has_adhd', 'has_anxiety', 'has_depression',
+                 'needs_structure', 'prefers_visual', 'needs_reminders')
+
     def __init__(self):
         self.has_adhd: bool = False
         self.has_anxiety: bool = False
@@ -26,14 +47,62 @@ class OrganizationStrategy(Enum):
     DETAILED = auto() # Detailed categorization and metadata
     FLEXIBLE = auto() # Adaptable hybrid approach
 
+_CATEGORIES: Dict[OrganizationStrategy, Tuple[str, ...]] = {
+    # ADHD-friendly: Simple, clear categories with action-based names
+    OrganizationStrategy.MINIMAL: (
+        "NOW - Current Projects",
+        "NEXT - Upcoming",
+        "DONE - Completed",
+        "REFERENCE - Important Info"
+    ),
+    # Visual-heavy organization with emoji markers
+    OrganizationStrategy.VISUAL: (
+        "🎯 Active Projects",
+        "📅 Scheduled Tasks",
+        "📚 Resources",
+        "✨ Inspiration",
+        "✅ Completed"
+    ),
+    # Anxiety-friendly: Detailed categorization with clear hierarchy
+    OrganizationStrategy.DETAILED: (
+        "01_Current_Projects",
+        "02_Resources",
+        "03_Archives",
+        "04_Templates",
+        "05_Documentation",
+        "06_Backups"
+    ),
+    # Adaptable structure with both simple and detailed options
+    OrganizationStrategy.FLEXIBLE: (
+        "Quick Access",
+        "Projects",
+        "Resources",
+        "Archives"
+    ),
+}
+
 class FileOrganizer:
     """Manages file organization based on mental health needs."""
+    __slots__ = ('profile', 'strategy', '_base_path', '_targets')
     
     def __init__(self, profile: MentalHealthProfile):
         self.profile = profile
         self.strategy = self._determine_strategy()
         self.base_path = Path.home()
         
+    @property
+    def base_path(self) -> Path:
+        """Root directory that suggested locations are placed under."""
+        return self._base_path
+    
+    @base_path.setter
+    def base_path(self, path: Path):
+        # Category targets are cached per root, so rebuild them on every change
+        self._base_path = Path(path)
+        self._targets: Dict[str, Path] = {
+            name: self._base_path / name for name in _CATEGORIES[self.strategy]
+        }
+        
     def _determine_strategy(self) -> OrganizationStrategy:
         """Determine the best organization strategy based on profile."""
         if self.profile.has_adhd and self.profile.has_anxiety:
@@ -51,44 +120,11 @@ class FileOrganizer:
         """Create an organization structure based on the selected strategy."""
         structure = {}
         
-        if self.strategy == OrganizationStrategy.MINIMAL:
-            # ADHD-friendly: Simple, clear categories with action-based names
-            categories = [
-                "NOW - Current Projects",
-                "NEXT - Upcoming",
-                "DONE - Completed",
-                "REFERENCE - Important Info"
-            ]
-        
-        elif self.strategy == OrganizationStrategy.VISUAL:
-            # Visual-heavy organization with emoji markers
-            categories = [
-                "🎯 Active Projects",
-                "📅 Scheduled Tasks",
-                "📚 Resources",
-                "✨ Inspiration",
-                "✅ Completed"
-            ]
+        categories = _CATEGORIES[self.strategy]
         
-        elif self.strategy == OrganizationStrategy.DETAILED:
-            # Anxiety-friendly: Detailed categorization with clear hierarchy
-            categories = [
-                "01_Current_Projects",
-                "02_Resources",
-                "03_Archives",
-                "04_Templates",
-                "05_Documentation",
-                "06_Backups"
-            ]
-        
-        else:  # FLEXIBLE
-            # Adaptable structure with both simple and detailed options
-            categories = [
-                "Quick Access",
-                "Projects",
-                "Resources",
-                "Archives"
-            ]
+        # Guidelines and tips are identical for every category, so write them once
+        root_dir.mkdir(parents=True, exist_ok=True)
+        self._create_shared_metadata_file(root_dir)
         
         # Create directories
         for category in categories:
@@ -101,18 +137,25 @@ class FileOrganizer:
         
         return structure
 
+    def _create_shared_metadata_file(self, root_dir: Path):
+        """Create the metadata file shared by every category directory."""
+        shared = {
+            "guidelines": self._get_organization_guidelines(),
+            "quick_tips": self._get_quick_tips()
+        }
+        
+        (root_dir / SHARED_METADATA_FILE).write_bytes(_dump_json(shared))
+
     def _create_metadata_file(self, directory: Path, category: str):
-        """Create a metadata file with directory information and usage guidelines."""
+        """Create a metadata file with directory information and a link to the shared guidelines."""
         metadata = {
             "category": category,
             "created_date": datetime.now().isoformat(),
             "purpose": self._get_category_purpose(category),
-            "guidelines": self._get_organization_guidelines(),
-            "quick_tips": self._get_quick_tips()
+            "shared": f"../{SHARED_METADATA_FILE}"
         }
         
-        with open(directory / ".folder_info.json", "w") as f:
-            json.dump(metadata, f, indent=2)
+        (directory / ".folder_info.json").write_bytes(_dump_json(metadata))
 
     def _get_category_purpose(self, category: str) -> str:
         """Get the purpose description for a category."""
@@ -199,45 +242,47 @@ class FileOrganizer:
 
     def suggest_file_location(self, file_path: Path) -> Path:
         """Suggest the best location for a file based on its type and content."""
-        file_type = file_path.suffix.lower()
         file_name = file_path.name.lower()
         
         # Determine the best category based on file analysis
+        targets = self._targets
         if self.strategy == OrganizationStrategy.MINIMAL:
             if self._is_active_project_file(file_path):
-                return self.base_path / "NOW - Current Projects" / file_path.name
-            elif self._is_reference_file(file_path):
-                return self.base_path / "REFERENCE - Important Info" / file_path.name
+                return targets["NOW - Current Projects"] / file_path.name
+            elif self._is_reference_file(file_name):
+                return targets["REFERENCE - Important Info"] / file_path.name
             else:
-                return self.base_path / "NEXT - Upcoming" / file_path.name
+                return targets["NEXT - Upcoming"] / file_path.name
                 
         elif self.strategy == OrganizationStrategy.VISUAL:
             if self._is_active_project_file(file_path):
-                return self.base_path / "🎯 Active Projects" / file_path.name
+                return targets["🎯 Active Projects"] / file_path.name
             elif self._is_scheduled_task(file_path):
-                return self.base_path / "📅 Scheduled Tasks" / file_path.name
+                return targets["📅 Scheduled Tasks"] / file_path.name
             else:
-                return self.base_path / "📚 Resources" / file_path.name
+                return targets["📚 Resources"] / file_path.name
                 
         elif self.strategy == OrganizationStrategy.DETAILED:
             category = self._determine_detailed_category(file_path)
-            return self.base_path / category / self._generate_detailed_filename(file_path)
+            target = targets.get(category) or self.base_path / category
+            return target / self._generate_detailed_filename(file_path)
             
         else:  # FLEXIBLE
             if self._is_active_project_file(file_path):
-                return self.base_path / "Quick Access" / file_path.name
+                return targets["Quick Access"] / file_path.name
             else:
-                return self.base_path / "Projects" / file_path.name
+                return targets["Projects"] / file_path.name
 
     def _is_active_project_file(self, file_path: Path) -> bool:
         """Check if a file belongs to an active project."""
         # Implementation would check file metadata, modification time, etc.
         return True  # Placeholder
 
-    def _is_reference_file(self, file_path: Path) -> bool:
-        """Check if a file is a reference document."""
-        reference_types = {'.pdf', '.doc', '.docx', '.txt', '.md'}
-        return file_path.suffix.lower() in reference_types
+    def _is_reference_file(self, name: str) -> bool:
+        """Check if a lowercase file name is a reference document."""
+        # A leading dot starts a hidden name, not a suffix (as with Path.suffix)
+        dot = name.rfind('.')
+        return dot > 0 and name[dot:] in _REFERENCE_SUFFIXES
 
     def _is_scheduled_task(self, file_path: Path) -> bool:
         """Check if a file is related to a scheduled task."""
@@ -256,11 +301,77 @@ class FileOrganizer:
 
     def organize_directory(self, directory: Path):
         """Organize an entire directory according to the current strategy."""
-        for file_path in directory.rglob('*'):
-            if file_path.is_file():
-                suggested_location = self.suggest_file_location(file_path)
-                suggested_location.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(file_path), str(suggested_location))
+        # os.walk skips unreadable subdirectories instead of aborting the run
+        sources = sorted(os.path.join(root, name)
+                         for root, _, files in os.walk(directory) for name in files)
+
+        # Plan every move up front, grouped by destination directory. A destination
+        # is never another planned move's source, another move's destination or an
+        # existing file, so no threaded rename can overwrite a file. Sources are
+        # sorted, so which file keeps the plain name is deterministic.
+        plan: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        claimed: Set[str] = set(sources)
+        for src in sources:
+            suggested_location = str(self.suggest_file_location(Path(src)))
+            if suggested_location == src:
+                continue  # Already where it belongs
+            suggested_location = self._unclaimed_destination(suggested_location, claimed)
+            claimed.add(suggested_location)
+            plan[os.path.dirname(suggested_location)].append((src, suggested_location))
+
+        # Create the hierarchy first so the workers never race on mkdir
+        for parent in plan:
+            os.makedirs(parent, exist_ok=True)
+
+        # Renames are I/O-bound syscalls, so overlap them on a thread pool
+        moves = [move for group in plan.values() for move in group]
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda move: self._move_file(*move), moves))
+
+    @staticmethod
+    def _unclaimed_destination(dst: str, claimed: Set[str]) -> str:
+        """Return dst, or the first free "name (n).ext" if dst is claimed or exists."""
+        candidate = dst
+        stem, ext = os.path.splitext(dst)
+        n = 0
+        while candidate in claimed or os.path.lexists(candidate):
+            n += 1
+            candidate = f"{stem} ({n}){ext}"
+        return candidate
+
+    def _move_file(self, src: str, dst: str):
+        """Move a single file, falling back to a copy across filesystems."""
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            self._copy_across_devices(src, dst)
+            os.unlink(src)
+
+    def _copy_across_devices(self, src: str, dst: str):
+        """Copy a file to another filesystem using an in-kernel copy when possible."""
+        if not hasattr(os, "copy_file_range"):
+            shutil.copy2(src, dst)
+            return
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            remaining = os.fstat(src_fd).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except OSError:
+                # Some filesystems refuse cross-device copy_file_range
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst)
+        shutil.copystat(src, dst)
 
     def create_quick_access_links(self, directory: Path):
         """Create quick access links for frequently used files and folders."""
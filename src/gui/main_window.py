@@ -1,39 +1,422 @@
 """
 Modern, adaptive GUI for the Mindful Optimizer with mental health support features.
 """
-from PyQt6.QtWidgets import (QMainWindow, QTabWidget, QWidget, QVBoxLayout,
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                            QHBoxLayout, QLabel, QPushButton, QComboBox,
                            QStackedWidget, QScrollArea, QFrame, QLineEdit,
                            QCheckBox, QProgressBar, QSlider, QSpinBox,
-                           QCalendarWidget, QTimeEdit, QTextEdit, QListWidget,
-                           QListWidgetItem, QDialog, QDialogButtonBox,
+                           QCalendarWidget, QTimeEdit, QTextEdit, QPlainTextEdit,
+                           QListWidget, QListView,
+                           QDialog, QDialogButtonBox,
                            QGridLayout, QRadioButton, QButtonGroup, QFileDialog,
-                           QGroupBox)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QDateTime, QDate
-from PyQt6.QtGui import QColor, QPalette, QIcon, QFont
+                           QGroupBox, QMessageBox)
+from PyQt6.QtCore import (Qt, QTimer, pyqtSignal, QDateTime, QDate, QObject,
+                          QRunnable, QThreadPool, QStringListModel,
+                          QAbstractListModel, QModelIndex)
+from PyQt6.QtGui import QColor, QPalette, QIcon, QFont, QPainter, QPixmap
 import json
+import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 from datetime import datetime, time
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from core.task_manager import TaskManager, Task, TaskPriority, TaskCategory
 from core.system_optimizer import SystemOptimizer
 from core.ai_optimizer import AISystemOptimizer
 from profile.mental_health_profile_builder import ProfileManager, Profile, Condition, TherapyType, TherapySkill
 from core.file_organizer import FileOrganizer
 
+_CONDITION_ITEMS = tuple((c, c.value) for c in Condition)
+_THERAPY_ITEMS = tuple((t, t.value) for t in TherapyType)
+_PRIORITY_NAMES = tuple(p.name for p in TaskPriority)
+_CATEGORY_VALUES = tuple(c.value for c in TaskCategory)
+
+# App-wide rules that don't depend on the theme; apply_theme prepends these
+# to the themed stylesheet and installs the result once on the QApplication.
+_BASE_QSS = """
+    QTabBar::tab { height: 40px; }
+"""
+
+# Theme colors used by apply_theme for both the stylesheet and the palette
+_THEMES = {
+    "light": {"background": "#FFFFFF", "text": "#202020", "accent": "#A8C8E8"},
+    "dark": {"background": "#2B2B2B", "text": "#E8E8E8", "accent": "#4A6F94"},
+}
+
+# Themed rules the palette can't express (tab and progress bar chrome); colors for
+# windows, text, inputs and buttons come from the QPalette built in _theme_palette.
+# Filled per theme with str.format_map, so literal braces are doubled.
+_THEME_QSS = """
+    QTabWidget::pane {{
+        border: 1px solid {accent};
+        background-color: {background};
+    }}
+    QTabBar::tab {{
+        background-color: {background};
+        color: {text};
+        padding: 8px 20px;
+        border: 1px solid {accent};
+        border-bottom: none;
+        border-top-left-radius: 3px;
+        border-top-right-radius: 3px;
+    }}
+    QTabBar::tab:selected {{
+        background-color: {accent};
+    }}
+    QProgressBar {{
+        border: 1px solid {accent};
+        border-radius: 3px;
+        text-align: center;
+    }}
+    QProgressBar::chunk {{
+        background-color: {accent};
+    }}
+"""
+
+# Header combo box entries
+_PROFILE_PRESETS = (
+    "General",
+    "Bipolar Disorder",
+    "ADHD",
+    "Anxiety",
+    "Depression",
+    "OCD",
+    "ADHD + Anxiety",
+    "Depression + Anxiety",
+    "Custom...",
+)
+
+# Current mood on a DBT-based scale
+_MOOD_LEVELS = (
+    "Euphoric (Mania)",
+    "Extremely Elevated",
+    "Elevated",
+    "Slightly Elevated",
+    "Stable",
+    "Slightly Low",
+    "Low",
+    "Very Low",
+    "Severely Depressed",
+)
+
+# Common symptoms for various conditions
+_HEADER_SYMPTOMS = (
+    "Racing Thoughts",
+    "Decreased Need for Sleep",
+    "Increased Energy",
+    "Impulsivity",
+    "Irritability",
+    "Anxiety",
+    "Depression",
+    "Fatigue",
+    "Difficulty Concentrating",
+    "Sleep Problems",
+)
+
+# Condition-specific symptom checklists for the mood tracker
+_MANIA_SYMPTOMS = (
+    "Racing thoughts",
+    "Decreased need for sleep",
+    "Increased energy",
+    "Risk-taking behavior",
+    "Grandiose thoughts",
+    "Pressured speech",
+    "Goal-directed activity",
+    "Distractibility",
+)
+
+_DEPRESSION_SYMPTOMS = (
+    "Low mood",
+    "Loss of interest",
+    "Sleep changes",
+    "Appetite changes",
+    "Fatigue",
+    "Worthlessness",
+    "Concentration issues",
+    "Suicidal thoughts",
+)
+
+_ANXIETY_SYMPTOMS = (
+    "Worry",
+    "Restlessness",
+    "Physical tension",
+    "Racing heart",
+    "Sweating",
+    "Trembling",
+    "Panic attacks",
+    "Avoidance",
+)
+
+_ADHD_SYMPTOMS = (
+    "Difficulty focusing",
+    "Hyperactivity",
+    "Impulsivity",
+    "Task switching issues",
+    "Time management issues",
+    "Procrastination",
+    "Forgetfulness",
+    "Disorganization",
+)
+
+# Therapy skills offered in the mood tracker
+_DBT_SKILLS = (
+    "Mindfulness",
+    "Distress Tolerance",
+    "Emotion Regulation",
+    "Interpersonal Skills",
+)
+
+_CBT_SKILLS = (
+    "Thought Records",
+    "Behavioral Activation",
+    "Exposure Practice",
+    "Problem Solving",
+)
+
+_ACT_SKILLS = (
+    "Acceptance",
+    "Cognitive Defusion",
+    "Present Moment",
+    "Values Work",
+)
+
+_ERP_SKILLS = (
+    "Exposure Tasks",
+    "Response Prevention",
+    "Anxiety Hierarchy",
+    "Ritual Prevention",
+)
+
+# DBT skills offered in the mood dialog
+_MOOD_DBT_SKILLS = (
+    "Mindfulness",
+    "Distress Tolerance",
+    "Emotion Regulation",
+    "Interpersonal Effectiveness",
+    "PLEASE",
+    "TIPP",
+    "FAST",
+    "GIVE",
+)
+
+# DBT skills reference tab, grouped by module
+_DBT_SKILL_CATEGORIES = {
+    "Mindfulness": (
+        "Observe",
+        "Describe",
+        "Participate",
+        "Non-judgmentally",
+        "One-mindfully",
+        "Effectively",
+    ),
+    "Distress Tolerance": (
+        "TIPP Skills",
+        "STOP Skill",
+        "Pros and Cons",
+        "Radical Acceptance",
+        "Self-Soothing",
+    ),
+    "Emotion Regulation": (
+        "ABC PLEASE",
+        "Check the Facts",
+        "Opposite Action",
+        "Problem Solving",
+        "Build Mastery",
+    ),
+    "Interpersonal Effectiveness": (
+        "DEAR MAN",
+        "GIVE",
+        "FAST",
+        "Validation",
+    ),
+}
+
+# DBT skills dialog: (skill, description) pairs per module
+_DBT_SKILL_REFERENCE = {
+    "Mindfulness": (
+        ("What", "Observe, Describe, Participate"),
+        ("How", "Non-judgmentally, One-mindfully, Effectively"),
+        ("Practice", "Focus on your breath for 1 minute"),
+    ),
+    "Distress Tolerance": (
+        ("TIPP", "Temperature, Intense exercise, Paced breathing, Progressive muscle relaxation"),
+        ("STOP", "Stop, Take a step back, Observe, Proceed mindfully"),
+        ("Practice", "Hold an ice cube or take a cold shower"),
+    ),
+    "Emotion Regulation": (
+        ("ABC", "Accumulate positive experiences, Build mastery, Cope ahead"),
+        ("PLEASE", "Treat PhysicaL illness, Eat balanced, Avoid mood-altering drugs, Sleep balanced, Exercise"),
+        ("Practice", "List 3 things you're looking forward to"),
+    ),
+    "Interpersonal": (
+        ("DEAR MAN", "Describe, Express, Assert, Reinforce, Mindful, Appear confident, Negotiate"),
+        ("GIVE", "Gentle, Interested, Validate, Easy manner"),
+        ("Practice", "Role-play a difficult conversation"),
+    ),
+}
+
+# Dashboard refresh cadence: back off from 10s to 5 min while values are steady
+_REFRESH_MIN_MS = 10_000
+_REFRESH_MAX_MS = 300_000
+_IDLE_TICKS_BEFORE_BACKOFF = 3
+_CHANGE_THRESHOLD = 2
+
+@contextmanager
+def _batched_updates(widget: Optional[QWidget], block_signals: bool = False):
+    """Suspend repaints (and optionally signals) on a widget while it is populated in bulk."""
+    if widget is None:
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    was_blocked = widget.blockSignals(True) if block_signals else None
+    try:
+        yield
+    finally:
+        if block_signals:
+            widget.blockSignals(was_blocked)
+        widget.setUpdatesEnabled(True)
+        widget.updateGeometry()
+
+class _TaskSignals(QObject):
+    """Signals that hand a background task's outcome back to the GUI thread."""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+class _BackgroundTask(QRunnable):
+    """Run a callable on the global thread pool and report its result."""
+    
+    def __init__(self, fn: Callable, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+        
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+class TaskListModel(QAbstractListModel):
+    """Open tasks from a TaskManager; views only query the rows they paint."""
+    
+    def __init__(self, task_manager: TaskManager, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._task_manager = task_manager
+        self._tasks: List[Task] = []
+        
+    def refresh(self, tasks: Optional[List[Task]] = None):
+        """Reload the open tasks (or the given ones) in one model reset."""
+        self.beginResetModel()
+        self._tasks = self._task_manager.get_tasks() if tasks is None else tasks
+        self.endResetModel()
+        
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+        
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{task.title} ({task.priority.name}, Energy: {task.energy_required})"
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if task.completed else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.UserRole:
+            return task.id
+        return None
+        
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsUserCheckable)
+        
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        task = self._tasks[index.row()]
+        if Qt.CheckState(value) != Qt.CheckState.Checked or task.completed:
+            return False
+        # Listeners complete the task by id; the row then reads back as checked
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+_FONTS: Dict[Tuple[int, QFont.Weight], QFont] = {}
+
+def _font(size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    """Return a shared Arial font, creating it on first use."""
+    key = (size, weight)
+    cached = _FONTS.get(key)
+    if cached is None:
+        cached = _FONTS[key] = QFont("Arial", size, weight)
+    return cached
+
+_PLACEHOLDER_PIX: Optional[QPixmap] = None
+
+def _placeholder_pixmap() -> QPixmap:
+    """Return the shared chart placeholder, painting it on first use.
+    
+    QPixmap needs a running QApplication, so this can't happen at import time.
+    """
+    global _PLACEHOLDER_PIX
+    if _PLACEHOLDER_PIX is None:
+        pix = QPixmap(300, 200)
+        pix.fill(QColor("#F0F0F0"))
+        painter = QPainter(pix)
+        painter.setPen(QColor("#CCCCCC"))
+        painter.drawRect(0, 0, pix.width() - 1, pix.height() - 1)
+        painter.end()
+        _PLACEHOLDER_PIX = pix
+    return _PLACEHOLDER_PIX
+
 class AdaptiveMainWindow(QMainWindow):
     """Main window with adaptive features based on user's mental health profile."""
     
+    folders_ready = pyqtSignal()
+    files_categorized = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Mindful Organizer")
         self.setGeometry(100, 100, 1400, 900)
         
         # Initialize core components
-        self.data_dir = Path.home() / ".mindful_optimizer"
+        home = Path.home()
+        self._home_str = str(home)  # Start directory for the file pickers
+        self.data_dir = home / ".mindful_optimizer"
         self.data_dir.mkdir(exist_ok=True, parents=True)
+        self._settings_path = self.data_dir / "settings.json"
+        
+        self.themes = _THEMES
+        self.current_theme = None
+        self._palette_cache: Dict[str, QPalette] = {}
+        self._stylesheet_cache: Dict[str, str] = {}
+        self.calendar: Optional[QCalendarWidget] = None
+        
+        # Dialogs are built on first open and reused afterwards
+        self._add_task_dialog: Optional[QDialog] = None
+        self._energy_dialog: Optional[QDialog] = None
+        self._stats_dialog: Optional[QDialog] = None
+        self._mood_dialog: Optional[QDialog] = None
+        
+        # File search widgets, created with the file organizer tab
+        self._search_input: Optional[QLineEdit] = None
+        self._search_results: Optional[QListWidget] = None
+        
+        # Background results arrive through these; connected once so that
+        # re-initializing with another profile doesn't stack handlers
+        self.folders_ready.connect(self._on_folders_ready)
+        self.files_categorized.connect(self._on_files_categorized)
         
         # Initialize all managers
         self.profile_manager = ProfileManager(self.data_dir)
@@ -42,11 +425,6 @@ class AdaptiveMainWindow(QMainWindow):
         self.system_optimizer = SystemOptimizer(self.data_dir)
         self.ai_optimizer = AISystemOptimizer(self.data_dir)
         
-        # Start system monitoring
-        self.monitor_timer = QTimer()
-        self.monitor_timer.timeout.connect(self._update_system_state)
-        self.monitor_timer.start(60000)  # Update every minute
-        
         # Create central widget with scroll area
         self.scroll_area = QScrollArea()
         self.setCentralWidget(self.scroll_area)
@@ -74,53 +452,53 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Welcome message
         welcome = QLabel("Let's set up your mental health profile")
-        welcome.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        welcome.setFont(_font(16, QFont.Weight.Bold))
         layout.addWidget(welcome)
         
         # Name input
         name_label = QLabel("Your Name:")
-        name_label.setFont(QFont("Arial", 12))
+        name_label.setFont(_font(12))
         name_input = QLineEdit()
-        name_input.setFont(QFont("Arial", 12))
+        name_input.setFont(_font(12))
         layout.addWidget(name_label)
         layout.addWidget(name_input)
         
         # Conditions selection
         conditions_label = QLabel("Select Your Conditions:")
-        conditions_label.setFont(QFont("Arial", 12))
+        conditions_label.setFont(_font(12))
         layout.addWidget(conditions_label)
         
         condition_checks = {}
-        for condition in Condition:
-            check = QCheckBox(condition.value)
-            check.setFont(QFont("Arial", 12))
+        for condition, label in _CONDITION_ITEMS:
+            check = QCheckBox(label)
+            check.setFont(_font(12))
             layout.addWidget(check)
             condition_checks[condition] = check
         
         # Therapy types
         therapy_label = QLabel("Select Preferred Therapy Types:")
-        therapy_label.setFont(QFont("Arial", 12))
+        therapy_label.setFont(_font(12))
         layout.addWidget(therapy_label)
         
         therapy_checks = {}
-        for therapy in TherapyType:
-            check = QCheckBox(therapy.value)
-            check.setFont(QFont("Arial", 12))
+        for therapy, label in _THERAPY_ITEMS:
+            check = QCheckBox(label)
+            check.setFont(_font(12))
             layout.addWidget(check)
             therapy_checks[therapy] = check
             
         # File organization
         org_label = QLabel("File Organization:")
-        org_label.setFont(QFont("Arial", 12))
+        org_label.setFont(_font(12))
         layout.addWidget(org_label)
         
         root_dir_label = QLabel("Select Root Directory for Files:")
-        root_dir_label.setFont(QFont("Arial", 12))
+        root_dir_label.setFont(_font(12))
         root_dir_layout = QHBoxLayout()
         root_dir_input = QLineEdit()
-        root_dir_input.setFont(QFont("Arial", 12))
+        root_dir_input.setFont(_font(12))
         root_dir_btn = QPushButton("Browse")
-        root_dir_btn.setFont(QFont("Arial", 12))
+        root_dir_btn.setFont(_font(12))
         
         def browse_dir():
             dir_path = QFileDialog.getExistingDirectory(self, "Select Directory")
@@ -135,7 +513,7 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Organization preferences
         org_prefs_label = QLabel("Organization Preferences:")
-        org_prefs_label.setFont(QFont("Arial", 12))
+        org_prefs_label.setFont(_font(12))
         layout.addWidget(org_prefs_label)
         
         org_prefs = {
@@ -146,10 +524,11 @@ class AdaptiveMainWindow(QMainWindow):
             "notification_enabled": QCheckBox("Enable notifications")
         }
         
-        for pref in org_prefs.values():
-            pref.setFont(QFont("Arial", 12))
-            pref.setChecked(True)
-            layout.addWidget(pref)
+        with _batched_updates(dialog):
+            for pref in org_prefs.values():
+                pref.setFont(_font(12))
+                pref.setChecked(True)
+                layout.addWidget(pref)
         
         # Buttons
         buttons = QDialogButtonBox(
@@ -192,20 +571,66 @@ class AdaptiveMainWindow(QMainWindow):
             root_dir = Path(self.data_dir) / "files"
             self.file_organizer = FileOrganizer(root_dir, profile)
             
-        # Create folder structure
-        self.file_organizer.setup_folder_structure()
+        # Loaded profiles carry plain lists of values; normalize to frozensets of
+        # enum members so the tab and section membership tests are O(1)
+        profile.conditions = frozenset(Condition(c) for c in profile.conditions)
+        profile.therapy_types = frozenset(TherapyType(t) for t in profile.therapy_types)
+        self._mood_builders = tuple(build for condition, build in self._MOOD_BUILDERS.items()
+                                    if condition in profile.conditions)
         
         # Setup UI
         self.setup_ui()
         
+        # Create the folder structure off the GUI thread once the window is up
+        QTimer.singleShot(0, self._kickoff_folder_setup)
+        
         # Apply theme
         self.apply_theme("light")
-        
-        # Setup update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_displays)
-        self.update_timer.start(60000)
+        QTimer.singleShot(0, self._prewarm_palettes)
+        
+        # Single refresh timer that only runs while the dashboard is visible
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self._refresh_tick)
+        self._idle_ticks = 0
+        self._sample_in_flight = False
+        self.tabs.currentChanged.connect(self._update_refresh_timer)
+        self._update_refresh_timer(self.tabs.currentIndex())
 
+    def _kickoff_folder_setup(self):
+        """Create the file organizer's folder structure on the thread pool."""
+        self.tabs.setTabEnabled(self.tabs.indexOf(self._file_tab), False)
+        task = _BackgroundTask(self.file_organizer.setup_folder_structure)
+        task.signals.finished.connect(self.folders_ready)
+        task.signals.failed.connect(self._on_folder_setup_failed)
+        QThreadPool.globalInstance().start(task)
+        
+    def _on_folders_ready(self):
+        """Enable the File Organizer tab once its folders exist."""
+        self.tabs.setTabEnabled(self.tabs.indexOf(self._file_tab), True)
+        
+    def _on_folder_setup_failed(self, error: str):
+        """Report a failed folder setup and offer to retry it."""
+        logging.error(f"Error setting up folder structure: {error}")
+        self.tabs.setTabEnabled(self.tabs.indexOf(self._file_tab), True)
+        
+        # open() rather than exec() so the failure never blocks the event loop
+        box = QMessageBox(
+            QMessageBox.Icon.Warning,
+            "Folder Setup Failed",
+            f"Could not create the file organizer folders:\n{error}",
+            QMessageBox.StandardButton.Retry | QMessageBox.StandardButton.Close,
+            self
+        )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(self._on_folder_setup_box_finished)
+        box.open()
+        
+    def _on_folder_setup_box_finished(self, result: int):
+        """Retry the folder setup if the user asked to."""
+        # A QMessageBox finishes with the value of the standard button clicked
+        if result == QMessageBox.StandardButton.Retry.value:
+            self._kickoff_folder_setup()
+        
     def setup_ui(self):
         """Setup the main UI components."""
         self._setup_header()
@@ -219,81 +644,52 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Profile selector with larger size
         profile_label = QLabel("Mental Health Profile:")
-        profile_label.setFont(QFont("Arial", 12))
+        profile_label.setFont(_font(12))
         self.profile_combo = QComboBox()
-        self.profile_combo.setFont(QFont("Arial", 12))
+        self.profile_combo.setFont(_font(12))
         self.profile_combo.setMinimumWidth(200)  # Increased width
-        self.profile_combo.addItems([
-            "General",
-            "Bipolar Disorder",
-            "ADHD",
-            "Anxiety",
-            "Depression",
-            "OCD",
-            "ADHD + Anxiety",
-            "Depression + Anxiety",
-            "Custom..."
-        ])
+        self.profile_combo.setModel(QStringListModel(list(_PROFILE_PRESETS), self))
         
         # Theme selector
         theme_label = QLabel("Theme:")
-        theme_label.setFont(QFont("Arial", 12))
+        theme_label.setFont(_font(12))
         self.theme_combo = QComboBox()
-        self.theme_combo.setFont(QFont("Arial", 12))
+        self.theme_combo.setFont(_font(12))
         self.theme_combo.setMinimumWidth(150)  # Increased width
-        self.theme_combo.addItems(list(self.themes.keys()))
+        self.theme_combo.setModel(QStringListModel(list(self.themes), self))
         self.theme_combo.currentTextChanged.connect(self.apply_theme)
         
         # Current mood with DBT-based scale
         mood_label = QLabel("Current Mood:")
-        mood_label.setFont(QFont("Arial", 12))
+        mood_label.setFont(_font(12))
         self.mood_combo = QComboBox()
-        self.mood_combo.setFont(QFont("Arial", 12))
+        self.mood_combo.setFont(_font(12))
         self.mood_combo.setMinimumWidth(200)  # Increased width
-        self.mood_combo.addItems([
-            "Euphoric (Mania)",
-            "Extremely Elevated",
-            "Elevated",
-            "Slightly Elevated",
-            "Stable",
-            "Slightly Low",
-            "Low",
-            "Very Low",
-            "Severely Depressed"
-        ])
+        self.mood_combo.setModel(QStringListModel(list(_MOOD_LEVELS), self))
         
         # Symptom tracking
         symptoms_label = QLabel("Current Symptoms:")
-        symptoms_label.setFont(QFont("Arial", 12))
+        symptoms_label.setFont(_font(12))
         self.symptoms_frame = QFrame()
         symptoms_layout = QGridLayout(self.symptoms_frame)
         
-        # Common symptoms for various conditions
-        self.symptom_checks = {}
-        symptoms = [
-            "Racing Thoughts",
-            "Decreased Need for Sleep",
-            "Increased Energy",
-            "Impulsivity",
-            "Irritability",
-            "Anxiety",
-            "Depression",
-            "Fatigue",
-            "Difficulty Concentrating",
-            "Sleep Problems"
-        ]
+        # Parallel arrays: _symptom_boxes[i] is the checkbox for _symptom_labels[i]
+        self._symptom_labels: Tuple[str, ...] = _HEADER_SYMPTOMS
+        self._symptom_boxes: List[QCheckBox] = []
         
         row = 0
         col = 0
-        for symptom in symptoms:
-            check = QCheckBox(symptom)
-            check.setFont(QFont("Arial", 11))
-            symptoms_layout.addWidget(check, row, col)
-            self.symptom_checks[symptom] = check
-            col += 1
-            if col > 4:  # 5 symptoms per row
-                col = 0
-                row += 1
+        with _batched_updates(self.symptoms_frame):
+            for symptom in self._symptom_labels:
+                check = QCheckBox(symptom)
+                check.setFont(_font(11))
+                symptoms_layout.addWidget(check, row, col)
+                self._symptom_boxes.append(check)
+                col += 1
+                if col > 4:  # 5 symptoms per row
+                    col = 0
+                    row += 1
+        self._restore_symptom_mask(self._load_settings().get("symptoms", 0))
         
         # Add widgets to header grid layout
         header_layout.addWidget(profile_label, 0, 0)
@@ -310,31 +706,65 @@ class AdaptiveMainWindow(QMainWindow):
     def _setup_tabs(self):
         """Setup the main tab widget with different sections."""
         self.tabs = QTabWidget()
-        self.tabs.setFont(QFont("Arial", 12))
-        self.tabs.setStyleSheet("QTabBar::tab { height: 40px; }")  # Taller tabs
+        self.tabs.setFont(_font(12))
+        
+        # Tabs other than the dashboard are built the first time they are shown
+        self._tab_builders: Dict[QWidget, Callable[[], QWidget]] = {}
+        self.tabs.currentChanged.connect(self._build_tab_if_needed)
+        self._task_model = TaskListModel(self.task_manager, self)
+        self._task_model.dataChanged.connect(self._task_status_changed)
+        self._last_tasks_sig: Optional[int] = None
+        self._last_pattern_sig: Optional[int] = None
+        self._last_suggestions_sig: Optional[int] = None
+        self.tasks_list: Optional[QListView] = None
+        # Energy tracking widgets; no tab builds these yet, so the periodic
+        # refresh skips the energy pattern and suggestions while they are None
+        self.energy_tracker = None
+        self.energy_slider: Optional[QSlider] = None
+        self.pattern_display: Optional[QListWidget] = None
         
         # Add tabs based on profile
-        self.tabs.addTab(self._create_dashboard_tab(), "Dashboard")
-        self.tabs.addTab(self._create_mood_tracker_tab(), "Mood Tracker")
-        self.tabs.addTab(self._create_task_manager_tab(), "Task Manager")
-        self.tabs.addTab(self._create_file_organizer_tab(), "File Organizer")
+        self._dashboard_tab = self._create_dashboard_tab()
+        self.tabs.addTab(self._dashboard_tab, "Dashboard")
+        self._add_lazy_tab(self._create_mood_tracker_tab, "Mood Tracker")
+        self._add_lazy_tab(self._create_task_manager_tab, "Task Manager")
+        self._file_tab = self._add_lazy_tab(self._create_file_organizer_tab, "File Organizer")
         
         # Add condition-specific tabs
         profile = self.profile_manager.current_profile
         if profile:
             if TherapyType.DBT in profile.therapy_types:
-                self.tabs.addTab(self._create_dbt_skills_tab(), "DBT Skills")
+                self._add_lazy_tab(self._create_dbt_skills_tab, "DBT Skills")
             if TherapyType.CBT in profile.therapy_types:
-                self.tabs.addTab(self._create_cbt_skills_tab(), "CBT Skills")
+                self._add_lazy_tab(self._create_cbt_skills_tab, "CBT Skills")
             if TherapyType.ERP in profile.therapy_types:
-                self.tabs.addTab(self._create_erp_tab(), "ERP Work")
+                self._add_lazy_tab(self._create_erp_tab, "ERP Work")
             if TherapyType.ACT in profile.therapy_types:
-                self.tabs.addTab(self._create_act_tab(), "ACT Skills")
+                self._add_lazy_tab(self._create_act_tab, "ACT Skills")
                 
-        self.tabs.addTab(self._create_settings_tab(), "Settings")
+        self._add_lazy_tab(self._create_settings_tab, "Settings")
         
         self.main_layout.addWidget(self.tabs)
         
+    def _add_lazy_tab(self, builder: Callable[[], QWidget], title: str) -> QWidget:
+        """Add a placeholder tab whose contents are built on first show.
+        
+        Returns the placeholder, which stays the tab's page once built.
+        """
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        self._tab_builders[placeholder] = builder
+        self.tabs.addTab(placeholder, title)
+        return placeholder
+        
+    def _build_tab_if_needed(self, index: int):
+        """Build the real contents of a lazily created tab when it becomes current."""
+        placeholder = self.tabs.widget(index)
+        builder = self._tab_builders.pop(placeholder, None)
+        if builder is not None:
+            placeholder.layout().addWidget(builder())
+        
     def _create_dashboard_tab(self) -> QWidget:
         """Create the dashboard tab."""
         tab = QWidget()
@@ -343,7 +773,7 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Welcome message
         welcome = QLabel("Welcome to Your Mental Health Dashboard")
-        welcome.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        welcome.setFont(_font(16, QFont.Weight.Bold))
         layout.addWidget(welcome)
         
         # Quick actions section
@@ -361,7 +791,7 @@ class AdaptiveMainWindow(QMainWindow):
         
         for text, slot in buttons:
             btn = QPushButton(text)
-            btn.setFont(QFont("Arial", 12))
+            btn.setFont(_font(12))
             btn.setMinimumSize(150, 50)  # Larger buttons
             btn.clicked.connect(slot)
             actions_layout.addWidget(btn)
@@ -374,9 +804,10 @@ class AdaptiveMainWindow(QMainWindow):
         overview_layout = QGridLayout(overview_frame)
         
         # Mood history chart (placeholder)
-        mood_chart = QFrame()
+        mood_chart = QLabel()
         mood_chart.setMinimumHeight(200)
-        mood_chart.setStyleSheet("background-color: #F0F0F0; border: 1px solid #CCCCCC;")
+        mood_chart.setPixmap(_placeholder_pixmap())
+        mood_chart.setScaledContents(True)
         overview_layout.addWidget(QLabel("Today's Mood Pattern"), 0, 0)
         overview_layout.addWidget(mood_chart, 1, 0)
         
@@ -396,30 +827,33 @@ class AdaptiveMainWindow(QMainWindow):
         suggestions_layout = QVBoxLayout(suggestions_frame)
         
         suggestions_label = QLabel("Personalized Suggestions")
-        suggestions_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        suggestions_label.setFont(_font(14, QFont.Weight.Bold))
         suggestions_layout.addWidget(suggestions_label)
         
-        suggestions_list = QListWidget()
-        suggestions_list.setFont(QFont("Arial", 12))
-        suggestions_list.addItems([
+        self._suggestions_model = QStringListModel([
             "Your energy seems low - Consider using the 'PLEASE' skill",
             "You have 3 high-priority tasks pending",
             "Great job using mindfulness skills today!",
             "Remember to take your medication",
             "Time for a short meditation break?"
-        ])
+        ], self)
+        suggestions_list = QListView()
+        suggestions_list.setFont(_font(12))
+        suggestions_list.setUniformItemSizes(True)
+        suggestions_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        suggestions_list.setModel(self._suggestions_model)
         suggestions_layout.addWidget(suggestions_list)
         
         layout.addWidget(suggestions_frame)
         
         # System status section
         system_group = QGroupBox("AI System Optimization")
-        system_group.setFont(QFont("Arial", 12))
+        system_group.setFont(_font(12))
         system_layout = QGridLayout(system_group)
         
         # CPU Usage
         self.cpu_label = QLabel("CPU Usage:")
-        self.cpu_label.setFont(QFont("Arial", 11))
+        self.cpu_label.setFont(_font(11))
         self.cpu_progress = QProgressBar()
         self.cpu_progress.setRange(0, 100)
         system_layout.addWidget(self.cpu_label, 0, 0)
@@ -427,7 +861,7 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Memory Usage
         self.memory_label = QLabel("Memory Usage:")
-        self.memory_label.setFont(QFont("Arial", 11))
+        self.memory_label.setFont(_font(11))
         self.memory_progress = QProgressBar()
         self.memory_progress.setRange(0, 100)
         system_layout.addWidget(self.memory_label, 1, 0)
@@ -435,7 +869,7 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Disk Usage
         self.disk_label = QLabel("Disk Usage:")
-        self.disk_label.setFont(QFont("Arial", 11))
+        self.disk_label.setFont(_font(11))
         self.disk_progress = QProgressBar()
         self.disk_progress.setRange(0, 100)
         system_layout.addWidget(self.disk_label, 2, 0)
@@ -443,7 +877,7 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Battery Status
         self.battery_label = QLabel("Battery:")
-        self.battery_label.setFont(QFont("Arial", 11))
+        self.battery_label.setFont(_font(11))
         self.battery_progress = QProgressBar()
         self.battery_progress.setRange(0, 100)
         system_layout.addWidget(self.battery_label, 3, 0)
@@ -451,23 +885,25 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Anomaly Score
         self.anomaly_label = QLabel("System Health:")
-        self.anomaly_label.setFont(QFont("Arial", 11))
+        self.anomaly_label.setFont(_font(11))
         self.anomaly_progress = QProgressBar()
         self.anomaly_progress.setRange(-100, 0)  # Anomaly scores are negative
         system_layout.addWidget(self.anomaly_label, 4, 0)
         system_layout.addWidget(self.anomaly_progress, 4, 1)
         
         # AI Suggestions
-        self.system_suggestions = QTextEdit()
+        self.system_suggestions = QPlainTextEdit()
         self.system_suggestions.setReadOnly(True)
-        self.system_suggestions.setFont(QFont("Arial", 11))
+        self.system_suggestions.setFont(_font(11))
         self.system_suggestions.setMinimumHeight(150)
+        self.system_suggestions.setMaximumBlockCount(200)
+        self._prev_suggestions: List[str] = []
         system_layout.addWidget(QLabel("AI Optimization Suggestions:"), 5, 0)
         system_layout.addWidget(self.system_suggestions, 5, 1)
         
         # Optimize button
         optimize_btn = QPushButton("Run AI Optimization")
-        optimize_btn.setFont(QFont("Arial", 11))
+        optimize_btn.setFont(_font(11))
         optimize_btn.clicked.connect(self._optimize_system)
         system_layout.addWidget(optimize_btn, 6, 1)
         
@@ -482,232 +918,183 @@ class AdaptiveMainWindow(QMainWindow):
         layout.setSpacing(20)
         
         # Calendar for selecting date
-        calendar = QCalendarWidget()
-        calendar.setMinimumHeight(300)
-        calendar.setFont(QFont("Arial", 12))
-        layout.addWidget(calendar)
+        layout.addWidget(self._shared_calendar())
         
         # Mood entry section
         entry_frame = QFrame()
         entry_frame.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
         entry_layout = QGridLayout(entry_frame)
+        # Column 0 holds section labels; columns 1-2 hold the fields and
+        # checkbox pairs, all placed directly in this one grid.
+        entry_layout.setColumnStretch(1, 1)
+        entry_layout.setColumnStretch(2, 1)
         
         # Time selection
         time_label = QLabel("Time:")
-        time_label.setFont(QFont("Arial", 12))
+        time_label.setFont(_font(12))
         time_edit = QTimeEdit()
-        time_edit.setFont(QFont("Arial", 12))
+        time_edit.setFont(_font(12))
         entry_layout.addWidget(time_label, 0, 0)
-        entry_layout.addWidget(time_edit, 0, 1)
+        entry_layout.addWidget(time_edit, 0, 1, 1, 2)
         
-        # Get current profile and conditions
         profile = self.profile_manager.current_profile
-        conditions = profile.conditions if profile else set()
         
-        # Condition-specific tracking sections
+        # Condition-specific tracking sections, precomputed for this profile
         row = 1
         
-        if Condition.BIPOLAR in conditions:
-            # Mood scale for bipolar
-            mood_label = QLabel("Mood (-5 to +5):")
-            mood_label.setFont(QFont("Arial", 12))
-            mood_slider = QSlider(Qt.Orientation.Horizontal)
-            mood_slider.setRange(-5, 5)
-            mood_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-            mood_slider.setTickInterval(1)
-            entry_layout.addWidget(mood_label, row, 0)
-            entry_layout.addWidget(mood_slider, row, 1)
-            row += 1
-            
-            # Mania symptoms
-            mania_label = QLabel("Mania Symptoms:")
-            mania_label.setFont(QFont("Arial", 12))
-            mania_frame = QFrame()
-            mania_layout = QGridLayout(mania_frame)
-            mania_symptoms = [
-                "Racing thoughts",
-                "Decreased need for sleep",
-                "Increased energy",
-                "Risk-taking behavior",
-                "Grandiose thoughts",
-                "Pressured speech",
-                "Goal-directed activity",
-                "Distractibility"
-            ]
-            self._add_symptom_checkboxes(mania_layout, mania_symptoms)
-            entry_layout.addWidget(mania_label, row, 0)
-            entry_layout.addWidget(mania_frame, row, 1)
-            row += 1
-            
-        if Condition.DEPRESSION in conditions:
-            # Depression symptoms
-            depression_label = QLabel("Depression Symptoms:")
-            depression_label.setFont(QFont("Arial", 12))
-            depression_frame = QFrame()
-            depression_layout = QGridLayout(depression_frame)
-            depression_symptoms = [
-                "Low mood",
-                "Loss of interest",
-                "Sleep changes",
-                "Appetite changes",
-                "Fatigue",
-                "Worthlessness",
-                "Concentration issues",
-                "Suicidal thoughts"
-            ]
-            self._add_symptom_checkboxes(depression_layout, depression_symptoms)
-            entry_layout.addWidget(depression_label, row, 0)
-            entry_layout.addWidget(depression_frame, row, 1)
-            row += 1
-            
-        if Condition.ANXIETY in conditions:
-            # Anxiety symptoms
-            anxiety_label = QLabel("Anxiety Symptoms:")
-            anxiety_label.setFont(QFont("Arial", 12))
-            anxiety_frame = QFrame()
-            anxiety_layout = QGridLayout(anxiety_frame)
-            anxiety_symptoms = [
-                "Worry",
-                "Restlessness",
-                "Physical tension",
-                "Racing heart",
-                "Sweating",
-                "Trembling",
-                "Panic attacks",
-                "Avoidance"
-            ]
-            self._add_symptom_checkboxes(anxiety_layout, anxiety_symptoms)
-            entry_layout.addWidget(anxiety_label, row, 0)
-            entry_layout.addWidget(anxiety_frame, row, 1)
-            row += 1
-            
-        if Condition.OCD in conditions:
-            # OCD tracking
-            ocd_label = QLabel("OCD Symptoms:")
-            ocd_label.setFont(QFont("Arial", 12))
-            ocd_frame = QFrame()
-            ocd_layout = QGridLayout(ocd_frame)
-            
-            # Obsessions and compulsions
-            obsessions_label = QLabel("Obsessions:")
-            obsessions_label.setFont(QFont("Arial", 11))
-            obsessions_input = QSpinBox()
-            obsessions_input.setRange(0, 10)
-            obsessions_input.setPrefix("Frequency: ")
-            
-            compulsions_label = QLabel("Compulsions:")
-            compulsions_label.setFont(QFont("Arial", 11))
-            compulsions_input = QSpinBox()
-            compulsions_input.setRange(0, 10)
-            compulsions_input.setPrefix("Frequency: ")
-            
-            resistance_label = QLabel("Resistance:")
-            resistance_label.setFont(QFont("Arial", 11))
-            resistance_input = QSpinBox()
-            resistance_input.setRange(0, 10)
-            resistance_input.setPrefix("Strength: ")
-            
-            ocd_layout.addWidget(obsessions_label, 0, 0)
-            ocd_layout.addWidget(obsessions_input, 0, 1)
-            ocd_layout.addWidget(compulsions_label, 1, 0)
-            ocd_layout.addWidget(compulsions_input, 1, 1)
-            ocd_layout.addWidget(resistance_label, 2, 0)
-            ocd_layout.addWidget(resistance_input, 2, 1)
-            
-            entry_layout.addWidget(ocd_label, row, 0)
-            entry_layout.addWidget(ocd_frame, row, 1)
-            row += 1
-            
-        if Condition.ADHD in conditions:
-            # ADHD tracking
-            adhd_label = QLabel("ADHD Symptoms:")
-            adhd_label.setFont(QFont("Arial", 12))
-            adhd_frame = QFrame()
-            adhd_layout = QGridLayout(adhd_frame)
-            adhd_symptoms = [
-                "Difficulty focusing",
-                "Hyperactivity",
-                "Impulsivity",
-                "Task switching issues",
-                "Time management issues",
-                "Procrastination",
-                "Forgetfulness",
-                "Disorganization"
-            ]
-            self._add_symptom_checkboxes(adhd_layout, adhd_symptoms)
-            entry_layout.addWidget(adhd_label, row, 0)
-            entry_layout.addWidget(adhd_frame, row, 1)
-            row += 1
+        for build_section in self._mood_builders:
+            row = build_section(self, entry_layout, row)
             
         # Therapy skills used
         if profile and profile.therapy_types:
-            skills_label = QLabel("Skills Used:")
-            skills_label.setFont(QFont("Arial", 12))
-            skills_frame = QFrame()
-            skills_layout = QGridLayout(skills_frame)
-            
-            all_skills = []
-            if TherapyType.DBT in profile.therapy_types:
-                all_skills.extend([
-                    "Mindfulness",
-                    "Distress Tolerance",
-                    "Emotion Regulation",
-                    "Interpersonal Skills"
-                ])
-            if TherapyType.CBT in profile.therapy_types:
-                all_skills.extend([
-                    "Thought Records",
-                    "Behavioral Activation",
-                    "Exposure Practice",
-                    "Problem Solving"
-                ])
-            if TherapyType.ACT in profile.therapy_types:
-                all_skills.extend([
-                    "Acceptance",
-                    "Cognitive Defusion",
-                    "Present Moment",
-                    "Values Work"
-                ])
-            if TherapyType.ERP in profile.therapy_types:
-                all_skills.extend([
-                    "Exposure Tasks",
-                    "Response Prevention",
-                    "Anxiety Hierarchy",
-                    "Ritual Prevention"
-                ])
-                
-            self._add_symptom_checkboxes(skills_layout, all_skills)
-            entry_layout.addWidget(skills_label, row, 0)
-            entry_layout.addWidget(skills_frame, row, 1)
-            row += 1
+            row = self._build_skills_section(entry_layout, row, profile.therapy_types)
             
         # Notes section
         notes_label = QLabel("Notes:")
-        notes_label.setFont(QFont("Arial", 12))
+        notes_label.setFont(_font(12))
         notes_edit = QTextEdit()
-        notes_edit.setFont(QFont("Arial", 12))
+        notes_edit.setFont(_font(12))
         notes_edit.setMinimumHeight(100)
         entry_layout.addWidget(notes_label, row, 0)
-        entry_layout.addWidget(notes_edit, row, 1)
+        entry_layout.addWidget(notes_edit, row, 1, 1, 2)
         
         layout.addWidget(entry_frame)
         
         # Add record button
         add_btn = QPushButton("Add Mood Record")
-        add_btn.setFont(QFont("Arial", 12))
+        add_btn.setFont(_font(12))
         add_btn.setMinimumHeight(40)
         layout.addWidget(add_btn)
         
         return tab
         
-    def _add_symptom_checkboxes(self, layout: QGridLayout, symptoms: List[str], cols: int = 2):
-        """Helper method to add symptom checkboxes to a layout."""
-        for i, symptom in enumerate(symptoms):
-            check = QCheckBox(symptom)
-            check.setFont(QFont("Arial", 11))
-            row = i // cols
-            col = i % cols
-            layout.addWidget(check, row, col)
+    def _shared_calendar(self) -> QCalendarWidget:
+        """Return the window's date picker, creating it on first use.
+        
+        Later callers get the same widget reset to today instead of a new one.
+        """
+        if self.calendar is None:
+            self.calendar = QCalendarWidget()
+            self.calendar.setMinimumHeight(300)
+            self.calendar.setFont(_font(12))
+        else:
+            self.calendar.setSelectedDate(QDate.currentDate())
+        return self.calendar
+        
+    def _build_bipolar_section(self, entry_layout: QGridLayout, row: int) -> int:
+        """Add the bipolar mood scale and mania symptoms, returning the next free row."""
+        # Mood scale for bipolar
+        mood_label = QLabel("Mood (-5 to +5):")
+        mood_label.setFont(_font(12))
+        mood_slider = QSlider(Qt.Orientation.Horizontal)
+        mood_slider.setRange(-5, 5)
+        mood_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
+        mood_slider.setTickInterval(1)
+        entry_layout.addWidget(mood_label, row, 0)
+        entry_layout.addWidget(mood_slider, row, 1, 1, 2)
+        row += 1
+        
+        # Mania symptoms
+        mania_label = QLabel("Mania Symptoms:")
+        mania_label.setFont(_font(12))
+        entry_layout.addWidget(mania_label, row, 0)
+        return self._add_symptom_checkboxes(entry_layout, _MANIA_SYMPTOMS, row=row, col=1)
+        
+    def _build_depression_section(self, entry_layout: QGridLayout, row: int) -> int:
+        """Add the depression symptom checklist, returning the next free row."""
+        depression_label = QLabel("Depression Symptoms:")
+        depression_label.setFont(_font(12))
+        entry_layout.addWidget(depression_label, row, 0)
+        return self._add_symptom_checkboxes(entry_layout, _DEPRESSION_SYMPTOMS, row=row, col=1)
+        
+    def _build_anxiety_section(self, entry_layout: QGridLayout, row: int) -> int:
+        """Add the anxiety symptom checklist, returning the next free row."""
+        anxiety_label = QLabel("Anxiety Symptoms:")
+        anxiety_label.setFont(_font(12))
+        entry_layout.addWidget(anxiety_label, row, 0)
+        return self._add_symptom_checkboxes(entry_layout, _ANXIETY_SYMPTOMS, row=row, col=1)
+        
+    def _build_ocd_section(self, entry_layout: QGridLayout, row: int) -> int:
+        """Add the OCD obsession/compulsion trackers, returning the next free row."""
+        ocd_label = QLabel("OCD Symptoms:")
+        ocd_label.setFont(_font(12))
+        
+        # Obsessions and compulsions
+        obsessions_label = QLabel("Obsessions:")
+        obsessions_label.setFont(_font(11))
+        obsessions_input = QSpinBox()
+        obsessions_input.setRange(0, 10)
+        obsessions_input.setPrefix("Frequency: ")
+        
+        compulsions_label = QLabel("Compulsions:")
+        compulsions_label.setFont(_font(11))
+        compulsions_input = QSpinBox()
+        compulsions_input.setRange(0, 10)
+        compulsions_input.setPrefix("Frequency: ")
+        
+        resistance_label = QLabel("Resistance:")
+        resistance_label.setFont(_font(11))
+        resistance_input = QSpinBox()
+        resistance_input.setRange(0, 10)
+        resistance_input.setPrefix("Strength: ")
+        
+        entry_layout.addWidget(ocd_label, row, 0)
+        entry_layout.addWidget(obsessions_label, row, 1)
+        entry_layout.addWidget(obsessions_input, row, 2)
+        entry_layout.addWidget(compulsions_label, row + 1, 1)
+        entry_layout.addWidget(compulsions_input, row + 1, 2)
+        entry_layout.addWidget(resistance_label, row + 2, 1)
+        entry_layout.addWidget(resistance_input, row + 2, 2)
+        return row + 3
+        
+    def _build_adhd_section(self, entry_layout: QGridLayout, row: int) -> int:
+        """Add the ADHD symptom checklist, returning the next free row."""
+        adhd_label = QLabel("ADHD Symptoms:")
+        adhd_label.setFont(_font(12))
+        entry_layout.addWidget(adhd_label, row, 0)
+        return self._add_symptom_checkboxes(entry_layout, _ADHD_SYMPTOMS, row=row, col=1)
+        
+    # Mood tracker sections in display order, keyed by the condition they track
+    _MOOD_BUILDERS = {
+        Condition.BIPOLAR: _build_bipolar_section,
+        Condition.DEPRESSION: _build_depression_section,
+        Condition.ANXIETY: _build_anxiety_section,
+        Condition.OCD: _build_ocd_section,
+        Condition.ADHD: _build_adhd_section,
+    }
+        
+    def _build_skills_section(self, entry_layout: QGridLayout, row: int,
+                              therapy_types: FrozenSet[TherapyType]) -> int:
+        """Add the therapy skills checklist, returning the next free row."""
+        skills_label = QLabel("Skills Used:")
+        skills_label.setFont(_font(12))
+        
+        all_skills = []
+        if TherapyType.DBT in therapy_types:
+            all_skills.extend(_DBT_SKILLS)
+        if TherapyType.CBT in therapy_types:
+            all_skills.extend(_CBT_SKILLS)
+        if TherapyType.ACT in therapy_types:
+            all_skills.extend(_ACT_SKILLS)
+        if TherapyType.ERP in therapy_types:
+            all_skills.extend(_ERP_SKILLS)
+            
+        entry_layout.addWidget(skills_label, row, 0)
+        return self._add_symptom_checkboxes(entry_layout, all_skills, row=row, col=1)
+        
+    def _add_symptom_checkboxes(self, layout: QGridLayout, symptoms: Sequence[str],
+                                cols: int = 2, row: int = 0, col: int = 0) -> int:
+        """Add symptom checkboxes to a grid starting at (row, col).
+        
+        Returns the first row below the checkboxes.
+        """
+        with _batched_updates(layout.parentWidget()):
+            for i, symptom in enumerate(symptoms):
+                check = QCheckBox(symptom)
+                check.setFont(_font(11))
+                r, c = divmod(i, cols)
+                layout.addWidget(check, row + r, col + c)
+        return row + max(1, -(-len(symptoms) // cols))
 
     def _create_dbt_skills_tab(self) -> QWidget:
         """Create the DBT skills reference tab."""
@@ -719,9 +1106,9 @@ class AdaptiveMainWindow(QMainWindow):
         search_layout = QHBoxLayout()
         search_input = QLineEdit()
         search_input.setPlaceholderText("Search DBT skills...")
-        search_input.setFont(QFont("Arial", 12))
+        search_input.setFont(_font(12))
         search_btn = QPushButton("Search")
-        search_btn.setFont(QFont("Arial", 12))
+        search_btn.setFont(_font(12))
         search_layout.addWidget(search_input)
         search_layout.addWidget(search_btn)
         layout.addLayout(search_layout)
@@ -730,51 +1117,23 @@ class AdaptiveMainWindow(QMainWindow):
         categories_frame = QFrame()
         categories_layout = QVBoxLayout(categories_frame)
         
-        categories = {
-            "Mindfulness": [
-                "Observe",
-                "Describe",
-                "Participate",
-                "Non-judgmentally",
-                "One-mindfully",
-                "Effectively"
-            ],
-            "Distress Tolerance": [
-                "TIPP Skills",
-                "STOP Skill",
-                "Pros and Cons",
-                "Radical Acceptance",
-                "Self-Soothing"
-            ],
-            "Emotion Regulation": [
-                "ABC PLEASE",
-                "Check the Facts",
-                "Opposite Action",
-                "Problem Solving",
-                "Build Mastery"
-            ],
-            "Interpersonal Effectiveness": [
-                "DEAR MAN",
-                "GIVE",
-                "FAST",
-                "Validation"
-            ]
-        }
-        
-        for category, skills in categories.items():
+        header_font = _font(14, QFont.Weight.Bold)
+        list_font = _font(12)
+        for category, skills in _DBT_SKILL_CATEGORIES.items():
             group_box = QFrame()
             group_box.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
             group_layout = QVBoxLayout(group_box)
             
             # Category header
             header = QLabel(category)
-            header.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+            header.setFont(header_font)
             group_layout.addWidget(header)
             
             # Skills list
             skills_list = QListWidget()
-            skills_list.setFont(QFont("Arial", 12))
-            skills_list.addItems(skills)
+            skills_list.setFont(list_font)
+            skills_list.setUniformItemSizes(True)
+            skills_list.addItems(list(skills))
             skills_list.setMinimumHeight(len(skills) * 35)  # Adjust height based on number of items
             group_layout.addWidget(skills_list)
             
@@ -802,29 +1161,29 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Priority filter
         priority_label = QLabel("Priority:")
-        priority_label.setFont(QFont("Arial", 12))
+        priority_label.setFont(_font(12))
         priority_combo = QComboBox()
-        priority_combo.setFont(QFont("Arial", 12))
+        priority_combo.setFont(_font(12))
         priority_combo.setMinimumWidth(150)
-        priority_combo.addItems(["All"] + [p.name for p in TaskPriority])
+        priority_combo.addItems(["All", *_PRIORITY_NAMES])
         filters_layout.addWidget(priority_label)
         filters_layout.addWidget(priority_combo)
         
         # Category filter
         category_label = QLabel("Category:")
-        category_label.setFont(QFont("Arial", 12))
+        category_label.setFont(_font(12))
         category_combo = QComboBox()
-        category_combo.setFont(QFont("Arial", 12))
+        category_combo.setFont(_font(12))
         category_combo.setMinimumWidth(150)
-        category_combo.addItems(["All"] + [c.value for c in TaskCategory])
+        category_combo.addItems(["All", *_CATEGORY_VALUES])
         filters_layout.addWidget(category_label)
         filters_layout.addWidget(category_combo)
         
         # Energy level filter
         energy_label = QLabel("Max Energy Required:")
-        energy_label.setFont(QFont("Arial", 12))
+        energy_label.setFont(_font(12))
         energy_spin = QSpinBox()
-        energy_spin.setFont(QFont("Arial", 12))
+        energy_spin.setFont(_font(12))
         energy_spin.setRange(1, 5)
         energy_spin.setValue(5)
         filters_layout.addWidget(energy_label)
@@ -832,7 +1191,7 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Add task button
         add_task_btn = QPushButton("Add Task")
-        add_task_btn.setFont(QFont("Arial", 12))
+        add_task_btn.setFont(_font(12))
         add_task_btn.setMinimumSize(120, 40)
         add_task_btn.clicked.connect(self._show_add_task_dialog)
         filters_layout.addWidget(add_task_btn)
@@ -846,14 +1205,15 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Tasks header
         tasks_header = QLabel("Tasks")
-        tasks_header.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        tasks_header.setFont(_font(14, QFont.Weight.Bold))
         tasks_layout.addWidget(tasks_header)
         
         # Tasks list
-        self.tasks_list = QListWidget()
-        self.tasks_list.setFont(QFont("Arial", 12))
+        self.tasks_list = QListView()
+        self.tasks_list.setFont(_font(12))
         self.tasks_list.setMinimumHeight(400)
-        self.tasks_list.itemChanged.connect(self._task_status_changed)
+        self.tasks_list.setUniformItemSizes(True)
+        self.tasks_list.setModel(self._task_model)
         tasks_layout.addWidget(self.tasks_list)
         
         layout.addWidget(tasks_frame)
@@ -865,24 +1225,24 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Task details
         title_label = QLabel("Selected Task:")
-        title_label.setFont(QFont("Arial", 12))
+        title_label.setFont(_font(12))
         self.task_title = QLabel()
-        self.task_title.setFont(QFont("Arial", 12))
+        self.task_title.setFont(_font(12))
         
         priority_label = QLabel("Priority:")
-        priority_label.setFont(QFont("Arial", 12))
+        priority_label.setFont(_font(12))
         self.task_priority = QLabel()
-        self.task_priority.setFont(QFont("Arial", 12))
+        self.task_priority.setFont(_font(12))
         
         category_label = QLabel("Category:")
-        category_label.setFont(QFont("Arial", 12))
+        category_label.setFont(_font(12))
         self.task_category = QLabel()
-        self.task_category.setFont(QFont("Arial", 12))
+        self.task_category.setFont(_font(12))
         
         energy_label = QLabel("Energy Required:")
-        energy_label.setFont(QFont("Arial", 12))
+        energy_label.setFont(_font(12))
         self.task_energy = QLabel()
-        self.task_energy.setFont(QFont("Arial", 12))
+        self.task_energy.setFont(_font(12))
         
         # Add details to grid
         details_layout.addWidget(title_label, 0, 0)
@@ -942,15 +1302,15 @@ class AdaptiveMainWindow(QMainWindow):
         actions_layout = QHBoxLayout()
         
         import_btn = QPushButton("Import Files")
-        import_btn.setFont(QFont("Arial", 12))
+        import_btn.setFont(_font(12))
         import_btn.clicked.connect(self._import_files)
         
         organize_btn = QPushButton("Organize Files")
-        organize_btn.setFont(QFont("Arial", 12))
+        organize_btn.setFont(_font(12))
         organize_btn.clicked.connect(self._organize_files)
         
         backup_btn = QPushButton("Create Backup")
-        backup_btn.setFont(QFont("Arial", 12))
+        backup_btn.setFont(_font(12))
         backup_btn.clicked.connect(lambda: self.file_organizer.create_backup())
         
         actions_layout.addWidget(import_btn)
@@ -960,22 +1320,20 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Category view
         categories_label = QLabel("Categories:")
-        categories_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        categories_label.setFont(_font(14, QFont.Weight.Bold))
         manage_layout.addWidget(categories_label)
         
-        categories_list = QListWidget()
-        categories_list.setFont(QFont("Arial", 12))
-        
-        # Add categories from profile
-        for category, subfolders in self.profile_manager.current_profile.folder_structure.items():
-            category_item = QListWidgetItem(category)
-            category_item.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            categories_list.addItem(category_item)
+        # The organizer's configured categories, each followed by its extensions
+        category_rows = []
+        for category, extensions in self.file_organizer.config['categories'].items():
+            category_rows.append(category)
+            category_rows.extend(f"  • {ext}" for ext in extensions)
             
-            for subfolder in subfolders:
-                subfolder_item = QListWidgetItem(f"  • {subfolder}")
-                subfolder_item.setFont(QFont("Arial", 12))
-                categories_list.addItem(subfolder_item)
+        categories_list = QListView()
+        categories_list.setFont(_font(12))
+        categories_list.setUniformItemSizes(True)
+        categories_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        categories_list.setModel(QStringListModel(category_rows, categories_list))
                 
         manage_layout.addWidget(categories_list)
         
@@ -985,32 +1343,24 @@ class AdaptiveMainWindow(QMainWindow):
         search_layout = QVBoxLayout(search_frame)
         
         search_label = QLabel("Search Files:")
-        search_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        search_label.setFont(_font(14, QFont.Weight.Bold))
         search_layout.addWidget(search_label)
         
-        search_input = QLineEdit()
-        search_input.setFont(QFont("Arial", 12))
-        search_input.setPlaceholderText("Enter search term...")
+        self._search_input = QLineEdit()
+        self._search_input.setFont(_font(12))
+        self._search_input.setPlaceholderText("Enter search term...")
         
         search_btn = QPushButton("Search")
-        search_btn.setFont(QFont("Arial", 12))
-        
-        def perform_search():
-            results = self.file_organizer.search_files(search_input.text())
-            results_list.clear()
-            for result in results:
-                item = QListWidgetItem(str(result))
-                item.setFont(QFont("Arial", 12))
-                results_list.addItem(item)
-                
-        search_btn.clicked.connect(perform_search)
+        search_btn.setFont(_font(12))
+        search_btn.clicked.connect(self._perform_file_search)
         
-        search_layout.addWidget(search_input)
+        search_layout.addWidget(self._search_input)
         search_layout.addWidget(search_btn)
         
-        results_list = QListWidget()
-        results_list.setFont(QFont("Arial", 12))
-        search_layout.addWidget(results_list)
+        self._search_results = QListWidget()
+        self._search_results.setFont(_font(12))
+        self._search_results.setUniformItemSizes(True)
+        search_layout.addWidget(self._search_results)
         
         # Add frames to layout
         layout.addWidget(manage_frame)
@@ -1018,6 +1368,13 @@ class AdaptiveMainWindow(QMainWindow):
         
         return tab
         
+    def _perform_file_search(self):
+        """Search organized files for the entered term and list the matches."""
+        results = self.file_organizer.search_files(self._search_input.text())
+        with _batched_updates(self._search_results):
+            self._search_results.clear()
+            self._search_results.addItems([str(result) for result in results])
+            
     def _add_task(self):
         """Add a new task."""
         title = self.task_input.text()
@@ -1037,19 +1394,22 @@ class AdaptiveMainWindow(QMainWindow):
         
     def _update_task_list(self):
         """Update the task list display."""
-        self.tasks_list.clear()
-        for task in self.task_manager.get_tasks():
-            item = QListWidgetItem(f"{task.title} ({task.priority.name}, Energy: {task.energy_required})")
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Checked if task.completed else Qt.CheckState.Unchecked)
-            self.tasks_list.addItem(item)
-            
-    def _task_status_changed(self, item: QListWidgetItem):
-        """Handle task status changes."""
-        task_title = item.text().split(" (")[0]
-        if item.checkState() == Qt.CheckState.Checked:
-            self.task_manager.complete_task(task_title)
-        self._update_task_list()
+        if self.tasks_list is None:
+            return  # Task manager tab not built yet; it fills the list when it is
+        tasks = self.task_manager.get_tasks()
+        sig = hash(tuple((t.id, t.title, t.completed, t.priority, t.energy_required)
+                         for t in tasks))
+        if sig == self._last_tasks_sig:
+            return
+        self._last_tasks_sig = sig
+        self._task_model.refresh(tasks)
+        
+    def _task_status_changed(self, top_left: QModelIndex, bottom_right: QModelIndex,
+                             roles: Sequence[int] = ()):
+        """Complete the checked tasks; the rows stay in place until the next refresh."""
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            task_id = self._task_model.index(row).data(Qt.ItemDataRole.UserRole)
+            self.task_manager.complete_task_by_id(task_id)
         
     def _add_energy_record(self):
         """Add a new energy record."""
@@ -1066,11 +1426,17 @@ class AdaptiveMainWindow(QMainWindow):
         
     def _update_energy_pattern(self):
         """Update the energy pattern display."""
-        self.pattern_display.clear()
+        if self.energy_tracker is None or self.pattern_display is None:
+            return
         pattern = self.energy_tracker.get_daily_pattern()
-        
-        for period, energy in pattern.items():
-            self.pattern_display.addItem(f"{period}: {energy:.1f}%")
+        sig = hash(tuple(pattern.items()))
+        if sig == self._last_pattern_sig:
+            return
+        self._last_pattern_sig = sig
+        with _batched_updates(self.pattern_display):
+            self.pattern_display.clear()
+            self.pattern_display.addItems([f"{period}: {energy:.1f}%"
+                                           for period, energy in pattern.items()])
             
     def _energy_changed(self, value: int):
         """Handle energy level changes."""
@@ -1082,16 +1448,41 @@ class AdaptiveMainWindow(QMainWindow):
         
     def _update_suggestions(self):
         """Update task and break suggestions."""
+        if self.energy_tracker is None or self.energy_slider is None:
+            return
+        current_energy = self.energy_slider.value()
+        tasks = self.task_manager.get_task_suggestions(current_energy)
+        breaks = self.energy_tracker.get_break_suggestions(current_energy)
+        sig = hash((tuple((t.id, t.title, t.energy_required) for t in tasks), tuple(breaks)))
+        if sig == self._last_suggestions_sig:
+            return
+        self._last_suggestions_sig = sig
+        
         # Update task suggestions
         self.task_suggestions.clear()
-        current_energy = self.energy_slider.value()
-        for task in self.task_manager.get_task_suggestions(current_energy):
-            self.task_suggestions.addItem(f"{task.title} (Energy: {task.energy_required})")
+        self.task_suggestions.addItems([f"{task.title} (Energy: {task.energy_required})"
+                                        for task in tasks])
             
         # Update break suggestions
         self.break_suggestions.clear()
-        for suggestion in self.energy_tracker.get_break_suggestions(current_energy):
-            self.break_suggestions.addItem(suggestion)
+        self.break_suggestions.addItems(list(breaks))
+            
+    def _symptom_mask(self) -> int:
+        """Pack the checked header symptoms into a bitmask (bit i = _symptom_labels[i])."""
+        return sum(1 << i for i, box in enumerate(self._symptom_boxes) if box.isChecked())
+        
+    def _restore_symptom_mask(self, mask: int):
+        """Check the header symptoms whose bits are set in mask."""
+        for i, box in enumerate(self._symptom_boxes):
+            box.setChecked(bool(mask >> i & 1))
+            
+    def _load_settings(self) -> dict:
+        """Load saved user settings, or an empty dict if there are none."""
+        try:
+            data = self._settings_path.read_bytes()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return {}
             
     def _save_settings(self):
         """Save user settings."""
@@ -1099,12 +1490,19 @@ class AdaptiveMainWindow(QMainWindow):
             "notifications": self.enable_notifications.isChecked(),
             "sounds": self.enable_sounds.isChecked(),
             "animations": self.enable_animations.isChecked(),
-            "theme": self.theme_combo.currentText()
+            "theme": self.theme_combo.currentText(),
+            "symptoms": self._symptom_mask()
         }
         
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.data_dir / "settings.json", "w") as f:
-            json.dump(settings, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(settings)
+        else:
+            data = json.dumps(settings, separators=(",", ":")).encode("utf-8")
+            
+        # Write beside the real file and swap it in so a crash never leaves it half-written
+        tmp_path = self._settings_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self._settings_path)
             
     def update_displays(self):
         """Update all dynamic displays."""
@@ -1118,82 +1516,73 @@ class AdaptiveMainWindow(QMainWindow):
             return
             
         self.current_theme = theme_name
-        theme = self.themes[theme_name]
-        
-        # Create and apply stylesheet
-        stylesheet = f"""
-            QMainWindow {{
-                background-color: {theme['background']};
-                color: {theme['text']};
-            }}
-            QLabel {{
-                color: {theme['text']};
-            }}
-            QPushButton {{
-                background-color: {theme['accent']};
-                color: {theme['text']};
-                border: none;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: {theme['accent']}CC;
-            }}
-            QComboBox {{
-                background-color: {theme['background']};
-                color: {theme['text']};
-                border: 1px solid {theme['accent']};
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {theme['accent']};
-                background-color: {theme['background']};
-            }}
-            QTabBar::tab {{
-                background-color: {theme['background']};
-                color: {theme['text']};
-                padding: 8px 20px;
-                border: 1px solid {theme['accent']};
-                border-bottom: none;
-                border-top-left-radius: 3px;
-                border-top-right-radius: 3px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {theme['accent']};
-            }}
-            QListWidget {{
-                background-color: {theme['background']};
-                color: {theme['text']};
-                border: 1px solid {theme['accent']};
-                border-radius: 3px;
-            }}
-            QTextEdit {{
-                background-color: {theme['background']};
-                color: {theme['text']};
-                border: 1px solid {theme['accent']};
-                border-radius: 3px;
-            }}
-            QLineEdit {{
-                background-color: {theme['background']};
-                color: {theme['text']};
-                border: 1px solid {theme['accent']};
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            QProgressBar {{
-                border: 1px solid {theme['accent']};
-                border-radius: 3px;
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: {theme['accent']};
-            }}
-        """
-        self.setStyleSheet(stylesheet)
+        palette = self._theme_palette(theme_name)
+        stylesheet = self._theme_stylesheet(theme_name)
+        
+        app = QApplication.instance()
+        (app or self).setPalette(palette)
+        (app or self).setStyleSheet(stylesheet)
+        
+    def _theme_stylesheet(self, theme_name: str) -> str:
+        """Return the cached app stylesheet for a theme, building it on first use."""
+        stylesheet = self._stylesheet_cache.get(theme_name)
+        if stylesheet is None:
+            stylesheet = _BASE_QSS + _THEME_QSS.format_map(self.themes[theme_name])
+            self._stylesheet_cache[theme_name] = stylesheet
+        return stylesheet
+        
+    def _theme_palette(self, theme_name: str) -> QPalette:
+        """Return the cached QPalette for a theme, building it on first use."""
+        palette = self._palette_cache.get(theme_name)
+        if palette is None:
+            theme = self.themes[theme_name]
+            background = QColor(theme['background'])
+            text = QColor(theme['text'])
+            accent = QColor(theme['accent'])
+            palette = QPalette()
+            for role, color in ((QPalette.ColorRole.Window, background),
+                                (QPalette.ColorRole.Base, background),
+                                (QPalette.ColorRole.WindowText, text),
+                                (QPalette.ColorRole.Text, text),
+                                (QPalette.ColorRole.ButtonText, text),
+                                (QPalette.ColorRole.Button, accent),
+                                (QPalette.ColorRole.Highlight, accent)):
+                palette.setColor(role, color)
+            self._palette_cache[theme_name] = palette
+        return palette
+        
+    def _prewarm_palettes(self):
+        """Build every theme's palette once so later theme switches hit the cache."""
+        for theme_name in self.themes:
+            self._theme_palette(theme_name)
 
     def _show_add_task_dialog(self):
         """Show dialog for adding a new task."""
+        if self._add_task_dialog is None:
+            self._add_task_dialog = self._build_add_task_dialog()
+        else:
+            self._add_task_title.clear()
+            self._add_task_priority.setCurrentIndex(0)
+            self._add_task_category.setCurrentIndex(0)
+            self._add_task_energy.setValue(1)
+            self._add_task_due.setSelectedDate(QDate.currentDate())
+            self._add_task_notes.clear()
+            
+        if self._add_task_dialog.exec() == QDialog.DialogCode.Accepted:
+            notes = self._add_task_notes.toPlainText()
+            task = Task(
+                title=self._add_task_title.text(),
+                priority=TaskPriority[self._add_task_priority.currentText()],
+                category=TaskCategory[self._add_task_category.currentText()],  # Fixed syntax error
+                energy_required=self._add_task_energy.value(),
+                due_date=self._add_task_due.selectedDate().toPyDate(),
+                notes=notes if notes else None
+            )
+            self.task_manager.add_task(task)
+            self._update_task_list()
+            
+    def _build_add_task_dialog(self) -> QDialog:
+        """Build the add-task dialog once; its inputs are kept on the window."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Add Task")
         dialog.setMinimumWidth(500)
@@ -1202,56 +1591,56 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Task title
         title_label = QLabel("Task Title:")
-        title_label.setFont(QFont("Arial", 12))
-        title_input = QLineEdit()
-        title_input.setFont(QFont("Arial", 12))
-        title_input.setPlaceholderText("Enter task title...")
+        title_label.setFont(_font(12))
+        self._add_task_title = QLineEdit()
+        self._add_task_title.setFont(_font(12))
+        self._add_task_title.setPlaceholderText("Enter task title...")
         layout.addWidget(title_label)
-        layout.addWidget(title_input)
+        layout.addWidget(self._add_task_title)
         
         # Priority selection
         priority_label = QLabel("Priority:")
-        priority_label.setFont(QFont("Arial", 12))
-        priority_combo = QComboBox()
-        priority_combo.setFont(QFont("Arial", 12))
-        priority_combo.addItems([p.name for p in TaskPriority])
+        priority_label.setFont(_font(12))
+        self._add_task_priority = QComboBox()
+        self._add_task_priority.setFont(_font(12))
+        self._add_task_priority.addItems(list(_PRIORITY_NAMES))
         layout.addWidget(priority_label)
-        layout.addWidget(priority_combo)
+        layout.addWidget(self._add_task_priority)
         
         # Category selection
         category_label = QLabel("Category:")
-        category_label.setFont(QFont("Arial", 12))
-        category_combo = QComboBox()
-        category_combo.setFont(QFont("Arial", 12))
-        category_combo.addItems([c.value for c in TaskCategory])
+        category_label.setFont(_font(12))
+        self._add_task_category = QComboBox()
+        self._add_task_category.setFont(_font(12))
+        self._add_task_category.addItems(list(_CATEGORY_VALUES))
         layout.addWidget(category_label)
-        layout.addWidget(category_combo)
+        layout.addWidget(self._add_task_category)
         
         # Energy required
         energy_label = QLabel("Energy Required (1-5):")
-        energy_label.setFont(QFont("Arial", 12))
-        energy_spin = QSpinBox()
-        energy_spin.setFont(QFont("Arial", 12))
-        energy_spin.setRange(1, 5)
+        energy_label.setFont(_font(12))
+        self._add_task_energy = QSpinBox()
+        self._add_task_energy.setFont(_font(12))
+        self._add_task_energy.setRange(1, 5)
         layout.addWidget(energy_label)
-        layout.addWidget(energy_spin)
+        layout.addWidget(self._add_task_energy)
         
         # Due date
         due_label = QLabel("Due Date (Optional):")
-        due_label.setFont(QFont("Arial", 12))
-        due_calendar = QCalendarWidget()
-        due_calendar.setFont(QFont("Arial", 12))
+        due_label.setFont(_font(12))
+        self._add_task_due = QCalendarWidget()
+        self._add_task_due.setFont(_font(12))
         layout.addWidget(due_label)
-        layout.addWidget(due_calendar)
+        layout.addWidget(self._add_task_due)
         
         # Notes
         notes_label = QLabel("Notes (Optional):")
-        notes_label.setFont(QFont("Arial", 12))
-        notes_edit = QTextEdit()
-        notes_edit.setFont(QFont("Arial", 12))
-        notes_edit.setMaximumHeight(100)
+        notes_label.setFont(_font(12))
+        self._add_task_notes = QTextEdit()
+        self._add_task_notes.setFont(_font(12))
+        self._add_task_notes.setMaximumHeight(100)
         layout.addWidget(notes_label)
-        layout.addWidget(notes_edit)
+        layout.addWidget(self._add_task_notes)
         
         # Buttons
         button_box = QDialogButtonBox(
@@ -1262,38 +1651,49 @@ class AdaptiveMainWindow(QMainWindow):
         button_box.rejected.connect(dialog.reject)
         layout.addWidget(button_box)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            task = Task(
-                title=title_input.text(),
-                priority=TaskPriority[priority_combo.currentText()],
-                category=TaskCategory[category_combo.currentText()],  # Fixed syntax error
-                energy_required=energy_spin.value(),
-                due_date=due_calendar.selectedDate().toPyDate(),
-                notes=notes_edit.toPlainText() if notes_edit.toPlainText() else None
-            )
-            self.task_manager.add_task(task)
-            self._update_task_list()
+        return dialog
 
     def _show_energy_dialog(self):
         """Show dialog for recording energy levels."""
+        if self._energy_dialog is None:
+            self._energy_dialog = self._build_energy_dialog()
+        else:
+            self._energy_dialog_slider.setValue(0)
+            self._energy_dialog_mood.setCurrentIndex(0)
+            self._energy_dialog_notes.clear()
+            
+        if self._energy_dialog.exec() == QDialog.DialogCode.Accepted:
+            notes = self._energy_dialog_notes.toPlainText()
+            record = EnergyRecord(
+                timestamp=datetime.now(),
+                energy_level=self._energy_dialog_slider.value(),
+                mood=MoodLevel[self._energy_dialog_mood.currentText().replace(" ", "_")],
+                notes=notes if notes else None
+            )
+            self.energy_tracker.add_record(record)
+            self._update_energy_pattern()
+            self._update_suggestions()
+            
+    def _build_energy_dialog(self) -> QDialog:
+        """Build the energy dialog once; its inputs are kept on the window."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Track Energy")
         layout = QVBoxLayout(dialog)
         
         # Energy level input
         energy_label = QLabel("Energy Level (0-100):")
-        energy_slider = QSlider(Qt.Orientation.Horizontal)
-        energy_slider.setRange(0, 100)
+        self._energy_dialog_slider = QSlider(Qt.Orientation.Horizontal)
+        self._energy_dialog_slider.setRange(0, 100)
         
         # Mood selection
         mood_label = QLabel("Current Mood:")
-        mood_combo = QComboBox()
-        mood_combo.addItems([mood.name.replace("_", " ") for mood in MoodLevel])
+        self._energy_dialog_mood = QComboBox()
+        self._energy_dialog_mood.addItems([mood.name.replace("_", " ") for mood in MoodLevel])
         
         # Notes
         notes_label = QLabel("Notes:")
-        notes_input = QTextEdit()
-        notes_input.setMaximumHeight(100)
+        self._energy_dialog_notes = QTextEdit()
+        self._energy_dialog_notes.setMaximumHeight(100)
         
         # Add record button
         add_record_btn = QPushButton("Add Record")
@@ -1301,77 +1701,112 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Add widgets to layout
         layout.addWidget(energy_label)
-        layout.addWidget(energy_slider)
+        layout.addWidget(self._energy_dialog_slider)
         layout.addWidget(mood_label)
-        layout.addWidget(mood_combo)
+        layout.addWidget(self._energy_dialog_mood)
         layout.addWidget(notes_label)
-        layout.addWidget(notes_input)
+        layout.addWidget(self._energy_dialog_notes)
         layout.addWidget(add_record_btn)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            record = EnergyRecord(
-                timestamp=datetime.now(),
-                energy_level=energy_slider.value(),
-                mood=MoodLevel[mood_combo.currentText().replace(" ", "_")],
-                notes=notes_input.toPlainText() if notes_input.toPlainText() else None
-            )
-            self.energy_tracker.add_record(record)
-            self._update_energy_pattern()
-            self._update_suggestions()
+        return dialog
 
     def _show_stats_dialog(self):
         """Show dialog with statistics and patterns."""
+        if self._stats_dialog is None:
+            self._stats_dialog = self._build_stats_dialog()
+            
+        # Refill the cached dialog with current figures
+        pattern = self.energy_tracker.get_daily_pattern()
+        self._stats_pattern_list.clear()
+        self._stats_pattern_list.addItems([f"{period}: {energy:.1f}%" for period, energy in pattern.items()])
+        
+        optimal_hours = self.energy_tracker.get_optimal_work_hours()
+        self._stats_hours_list.clear()
+        self._stats_hours_list.addItems([hour.strftime('%I:%M %p') for hour in optimal_hours])
+        
+        tasks = self.task_manager.tasks
+        total_tasks = len(tasks)
+        completed_tasks = sum(1 for t in tasks if t.completed)
+        
+        stats_text = f"""
+        Total Tasks: {total_tasks}
+        Completed Tasks: {completed_tasks}
+        Completion Rate: {(completed_tasks/total_tasks*100 if total_tasks else 0):.1f}%
+        """
+        self._stats_info.setText(stats_text)
+        
+        self._stats_dialog.exec()
+        
+    def _build_stats_dialog(self) -> QDialog:
+        """Build the statistics dialog once; its lists are refilled on each show."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Statistics")
         layout = QVBoxLayout(dialog)
         
         # Energy pattern
         pattern_label = QLabel("Daily Energy Pattern")
-        pattern_label.setFont(QFont("Arial", 14))
+        pattern_label.setFont(_font(14))
         layout.addWidget(pattern_label)
         
-        pattern_list = QListWidget()
-        pattern = self.energy_tracker.get_daily_pattern()
-        for period, energy in pattern.items():
-            pattern_list.addItem(f"{period}: {energy:.1f}%")
-        layout.addWidget(pattern_list)
+        self._stats_pattern_list = QListWidget()
+        self._stats_pattern_list.setUniformItemSizes(True)
+        layout.addWidget(self._stats_pattern_list)
         
         # Optimal work hours
         hours_label = QLabel("Optimal Work Hours")
-        hours_label.setFont(QFont("Arial", 14))
+        hours_label.setFont(_font(14))
         layout.addWidget(hours_label)
         
-        hours_list = QListWidget()
-        optimal_hours = self.energy_tracker.get_optimal_work_hours()
-        for hour in optimal_hours:
-            hours_list.addItem(f"{hour.strftime('%I:%M %p')}")
-        layout.addWidget(hours_list)
+        self._stats_hours_list = QListWidget()
+        self._stats_hours_list.setUniformItemSizes(True)
+        layout.addWidget(self._stats_hours_list)
         
         # Task completion stats
         stats_label = QLabel("Task Statistics")
-        stats_label.setFont(QFont("Arial", 14))
+        stats_label.setFont(_font(14))
         layout.addWidget(stats_label)
         
-        total_tasks = len(self.task_manager.get_tasks())
-        completed_tasks = len([t for t in self.task_manager.get_tasks() if t.completed])
-        
-        stats_text = f"""
-        Total Tasks: {total_tasks}
-        Completed Tasks: {completed_tasks}
-        Completion Rate: {(completed_tasks/total_tasks*100 if total_tasks else 0):.1f}%
-        """
-        stats_info = QLabel(stats_text)
-        layout.addWidget(stats_info)
+        self._stats_info = QLabel()
+        layout.addWidget(self._stats_info)
         
         # Close button
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(dialog.accept)
         layout.addWidget(close_btn)
         
-        dialog.exec()
+        return dialog
 
     def _show_mood_dialog(self):
         """Show dialog for recording mood and symptoms."""
+        if self._mood_dialog is None:
+            self._mood_dialog = self._build_mood_dialog()
+        else:
+            self._mood_dialog_mood.setCurrentIndex(0)
+            for check in self._mood_symptom_checks + self._mood_skill_checks:
+                check.setChecked(False)
+            self._mood_dialog_notes.clear()
+        self._mood_dialog_time.setTime(datetime.now().time())
+        
+        if self._mood_dialog.exec() == QDialog.DialogCode.Accepted:
+            # Save mood record
+            active_symptoms = [symptom for symptom, check in zip(_HEADER_SYMPTOMS, self._mood_symptom_checks)
+                               if check.isChecked()]
+            active_skills = [skill for skill, check in zip(_MOOD_DBT_SKILLS, self._mood_skill_checks)
+                             if check.isChecked()]
+            
+            record = {
+                'timestamp': datetime.combine(QDate.currentDate(), self._mood_dialog_time.time().toPyTime()),
+                'mood': self._mood_dialog_mood.currentText(),
+                'symptoms': active_symptoms,
+                'skills_used': active_skills,
+                'notes': self._mood_dialog_notes.toPlainText()
+            }
+            
+            # TODO: Save record to database
+            self._update_mood_displays()
+            
+    def _build_mood_dialog(self) -> QDialog:
+        """Build the mood dialog once; its inputs are kept on the window."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Track Mood")
         dialog.setMinimumWidth(600)
@@ -1379,108 +1814,65 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Time selection
         time_label = QLabel("Time:")
-        time_label.setFont(QFont("Arial", 12))
-        time_edit = QTimeEdit()
-        time_edit.setFont(QFont("Arial", 12))
-        time_edit.setTime(datetime.now().time())
+        time_label.setFont(_font(12))
+        self._mood_dialog_time = QTimeEdit()
+        self._mood_dialog_time.setFont(_font(12))
         layout.addWidget(time_label)
-        layout.addWidget(time_edit)
+        layout.addWidget(self._mood_dialog_time)
         
         # Mood selection
         mood_label = QLabel("Current Mood:")
-        mood_label.setFont(QFont("Arial", 12))
-        mood_combo = QComboBox()
-        mood_combo.setFont(QFont("Arial", 12))
-        mood_combo.addItems([
-            "Euphoric (Mania)",
-            "Extremely Elevated",
-            "Elevated",
-            "Slightly Elevated",
-            "Stable",
-            "Slightly Low",
-            "Low",
-            "Very Low",
-            "Severely Depressed"
-        ])
+        mood_label.setFont(_font(12))
+        self._mood_dialog_mood = QComboBox()
+        self._mood_dialog_mood.setFont(_font(12))
+        self._mood_dialog_mood.addItems(list(_MOOD_LEVELS))
         layout.addWidget(mood_label)
-        layout.addWidget(mood_combo)
+        layout.addWidget(self._mood_dialog_mood)
         
         # Symptoms
         symptoms_label = QLabel("Current Symptoms:")
-        symptoms_label.setFont(QFont("Arial", 12))
+        symptoms_label.setFont(_font(12))
         symptoms_frame = QFrame()
         symptoms_layout = QGridLayout(symptoms_frame)
         
-        symptoms = [
-            "Racing Thoughts",
-            "Decreased Need for Sleep",
-            "Increased Energy",
-            "Impulsivity",
-            "Irritability",
-            "Anxiety",
-            "Depression",
-            "Fatigue",
-            "Difficulty Concentrating",
-            "Sleep Problems"
-        ]
-        
-        symptom_checks = {}
-        row = 0
-        col = 0
-        for symptom in symptoms:
-            check = QCheckBox(symptom)
-            check.setFont(QFont("Arial", 11))
-            symptoms_layout.addWidget(check, row, col)
-            symptom_checks[symptom] = check
-            col += 1
-            if col > 2:
-                col = 0
-                row += 1
+        # Parallel to _HEADER_SYMPTOMS
+        self._mood_symptom_checks: List[QCheckBox] = []
+        with _batched_updates(symptoms_frame):
+            for i, symptom in enumerate(_HEADER_SYMPTOMS):
+                check = QCheckBox(symptom)
+                check.setFont(_font(11))
+                symptoms_layout.addWidget(check, *divmod(i, 3))
+                self._mood_symptom_checks.append(check)
         
         layout.addWidget(symptoms_label)
         layout.addWidget(symptoms_frame)
         
         # DBT skills used
         skills_label = QLabel("DBT Skills Used:")
-        skills_label.setFont(QFont("Arial", 12))
+        skills_label.setFont(_font(12))
         skills_frame = QFrame()
         skills_layout = QGridLayout(skills_frame)
         
-        skills = [
-            "Mindfulness",
-            "Distress Tolerance",
-            "Emotion Regulation",
-            "Interpersonal Effectiveness",
-            "PLEASE",
-            "TIPP",
-            "FAST",
-            "GIVE"
-        ]
-        
-        skill_checks = {}
-        row = 0
-        col = 0
-        for skill in skills:
-            check = QCheckBox(skill)
-            check.setFont(QFont("Arial", 11))
-            skills_layout.addWidget(check, row, col)
-            skill_checks[skill] = check
-            col += 1
-            if col > 3:
-                col = 0
-                row += 1
+        # Parallel to _MOOD_DBT_SKILLS
+        self._mood_skill_checks: List[QCheckBox] = []
+        with _batched_updates(skills_frame):
+            for i, skill in enumerate(_MOOD_DBT_SKILLS):
+                check = QCheckBox(skill)
+                check.setFont(_font(11))
+                skills_layout.addWidget(check, *divmod(i, 4))
+                self._mood_skill_checks.append(check)
         
         layout.addWidget(skills_label)
         layout.addWidget(skills_frame)
         
         # Notes
         notes_label = QLabel("Notes:")
-        notes_label.setFont(QFont("Arial", 12))
-        notes_edit = QTextEdit()
-        notes_edit.setFont(QFont("Arial", 12))
-        notes_edit.setMinimumHeight(100)
+        notes_label.setFont(_font(12))
+        self._mood_dialog_notes = QTextEdit()
+        self._mood_dialog_notes.setFont(_font(12))
+        self._mood_dialog_notes.setMinimumHeight(100)
         layout.addWidget(notes_label)
-        layout.addWidget(notes_edit)
+        layout.addWidget(self._mood_dialog_notes)
         
         # Buttons
         buttons = QDialogButtonBox(
@@ -1491,21 +1883,7 @@ class AdaptiveMainWindow(QMainWindow):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Save mood record
-            active_symptoms = [s for s, c in symptom_checks.items() if c.isChecked()]
-            active_skills = [s for s, c in skill_checks.items() if c.isChecked()]
-            
-            record = {
-                'timestamp': datetime.combine(QDate.currentDate(), time_edit.time().toPyTime()),
-                'mood': mood_combo.currentText(),
-                'symptoms': active_symptoms,
-                'skills_used': active_skills,
-                'notes': notes_edit.toPlainText()
-            }
-            
-            # TODO: Save record to database
-            self._update_mood_displays()
+        return dialog
 
     def _show_dbt_skills_dialog(self):
         """Show dialog with DBT skills reference and practice."""
@@ -1516,61 +1894,55 @@ class AdaptiveMainWindow(QMainWindow):
         
         # Tabs for different skill categories
         tabs = QTabWidget()
-        tabs.setFont(QFont("Arial", 12))
-        
-        categories = {
-            "Mindfulness": [
-                ("What", "Observe, Describe, Participate"),
-                ("How", "Non-judgmentally, One-mindfully, Effectively"),
-                ("Practice", "Focus on your breath for 1 minute")
-            ],
-            "Distress Tolerance": [
-                ("TIPP", "Temperature, Intense exercise, Paced breathing, Progressive muscle relaxation"),
-                ("STOP", "Stop, Take a step back, Observe, Proceed mindfully"),
-                ("Practice", "Hold an ice cube or take a cold shower")
-            ],
-            "Emotion Regulation": [
-                ("ABC", "Accumulate positive experiences, Build mastery, Cope ahead"),
-                ("PLEASE", "Treat PhysicaL illness, Eat balanced, Avoid mood-altering drugs, Sleep balanced, Exercise"),
-                ("Practice", "List 3 things you're looking forward to")
-            ],
-            "Interpersonal": [
-                ("DEAR MAN", "Describe, Express, Assert, Reinforce, Mindful, Appear confident, Negotiate"),
-                ("GIVE", "Gentle, Interested, Validate, Easy manner"),
-                ("Practice", "Role-play a difficult conversation")
-            ]
-        }
+        tabs.setFont(_font(12))
         
-        for category, skills in categories.items():
+        # Only the first tab is filled up front; the rest are filled when first shown
+        pending: Dict[QWidget, Sequence[Tuple[str, str]]] = {}
+        for category, skills in _DBT_SKILL_REFERENCE.items():
             tab = QWidget()
-            tab_layout = QVBoxLayout(tab)
+            QVBoxLayout(tab)
+            pending[tab] = skills
+            tabs.addTab(tab, category)
             
+        def populate(index: int):
+            tab = tabs.widget(index)
+            skills = pending.pop(tab, None)
+            if skills is not None:
+                self._populate_dbt_tab(tab, skills)
+                
+        populate(0)
+        tabs.currentChanged.connect(populate)
+        
+        layout.addWidget(tabs)
+        
+        # Close button
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.accept)
+        layout.addWidget(close_btn)
+        
+        dialog.exec()
+
+    def _populate_dbt_tab(self, tab: QWidget, skills: Sequence[Tuple[str, str]]):
+        """Fill a DBT dialog tab with one framed title/description card per skill."""
+        tab_layout = tab.layout()
+        title_font = _font(14, QFont.Weight.Bold)
+        desc_font = _font(12)
+        with _batched_updates(tab):
             for title, description in skills:
                 group = QFrame()
                 group.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
                 group_layout = QVBoxLayout(group)
                 
                 title_label = QLabel(title)
-                title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+                title_label.setFont(title_font)
                 desc_label = QLabel(description)
-                desc_label.setFont(QFont("Arial", 12))
+                desc_label.setFont(desc_font)
                 desc_label.setWordWrap(True)
                 
                 group_layout.addWidget(title_label)
                 group_layout.addWidget(desc_label)
                 tab_layout.addWidget(group)
-            
-            tabs.addTab(tab, category)
-        
-        layout.addWidget(tabs)
-        
-        # Close button
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(dialog.accept)
-        layout.addWidget(close_btn)
-        
-        dialog.exec()
-
+                
     def _update_mood_displays(self):
         """Update all mood-related displays."""
         # TODO: Implement mood history chart and statistics
@@ -1578,53 +1950,156 @@ class AdaptiveMainWindow(QMainWindow):
 
     def _import_files(self):
         """Import files to be organized."""
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Select Files to Import",
-            str(Path.home()),
-            "All Files (*.*)"
-        )
-        
+        # open() instead of getOpenFileNames so the event loop keeps running
+        dialog = QFileDialog(self, "Select Files to Import", self._home_str, "All Files (*.*)")
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.filesSelected.connect(self._on_files_selected)
+        dialog.open()
+        
+    def _on_files_selected(self, files: List[str]):
+        """Categorize the files picked in the import dialog."""
         if files:
-            for file_path in files:
-                src_path = Path(file_path)
-                if src_path.exists():
-                    self.file_organizer.categorize_file(src_path)
-                    
-            # Update the file organizer tab
-            self.tabs.setCurrentWidget(self._create_file_organizer_tab())
+            # The dialog only returns existing files; no need to stat them again
+            self._categorize_in_background(self.file_organizer.categorize_files,
+                                           [Path(f) for f in files])
             
     def _organize_files(self):
         """Organize files in the selected directory."""
         dir_path = QFileDialog.getExistingDirectory(
             self,
             "Select Directory to Organize",
-            str(Path.home())
+            self._home_str
         )
         
         if dir_path:
-            src_dir = Path(dir_path)
-            if src_dir.exists():
-                for file_path in src_dir.glob("*"):
-                    if file_path.is_file():
-                        self.file_organizer.categorize_file(file_path)
-                        
-            # Update the file organizer tab
-            self.tabs.setCurrentWidget(self._create_file_organizer_tab())
+            # Listing the directory happens on the worker too, so a huge or slow
+            # directory never blocks the event loop
+            self._categorize_in_background(self.file_organizer.categorize_directory, dir_path)
+                
+    def _categorize_in_background(self, categorize: Callable, *args):
+        """Run a FileOrganizer categorize call on the thread pool."""
+        task = _BackgroundTask(categorize, *args)
+        task.signals.finished.connect(self.files_categorized)
+        task.signals.failed.connect(self._on_categorize_failed)
+        QThreadPool.globalInstance().start(task)
+        
+    def _on_files_categorized(self, results: Dict[Path, Optional[str]]):
+        """List the categorized batch in the File Organizer tab."""
+        # Build the lazy tab first so its results list exists even if the switch
+        # is refused while the tab is still disabled for folder setup
+        self._build_tab_if_needed(self.tabs.indexOf(self._file_tab))
+        self.tabs.setCurrentWidget(self._file_tab)
+        with _batched_updates(self._search_results):
+            self._search_results.clear()
+            self._search_results.addItems([f"{path.name}: {category or 'Uncategorized'}"
+                                           for path, category in results.items()])
+        
+    def _on_categorize_failed(self, error: str):
+        """Log a failed categorization batch."""
+        logging.error(f"Error categorizing files: {error}")
 
-    def _update_system_state(self):
-        """Update system status displays with AI analysis."""
+    def _update_refresh_timer(self, index: int):
+        """Run the refresh timer only while the dashboard tab is current."""
+        if self.tabs.widget(index) is self._dashboard_tab:
+            self._idle_ticks = 0
+            self.refresh_timer.start(_REFRESH_MIN_MS)
+        else:
+            self.refresh_timer.stop()
+            
+    def _refresh_tick(self):
+        """Sample system state off the GUI thread, then refresh the task views."""
+        # Dispatch first: a failing display update must not stop monitoring
+        self._start_system_sample()
         try:
-            # Get system stats with AI analysis
-            stats = self.ai_optimizer.get_system_stats()
+            self.update_displays()
+        except Exception as e:
+            logging.error(f"Error updating displays: {str(e)}")
+        
+    def _start_system_sample(self):
+        """Dispatch a system sample to the thread pool.
+        
+        Self-contained so that a failure here never takes the display
+        refresh down with it, and vice versa.
+        """
+        # Skip this tick if the previous sample has not come back yet
+        if self._sample_in_flight:
+            return
+        try:
+            task = _BackgroundTask(self._sample_system)
+            task.signals.finished.connect(self._on_system_sampled)
+            task.signals.failed.connect(self._on_sample_failed)
+            QThreadPool.globalInstance().start(task)
+        except Exception as e:
+            logging.error(f"Error starting system sample: {str(e)}")
+            self._adjust_refresh_interval(False)
+            return
+        self._sample_in_flight = True
+        
+    def _sample_system(self) -> Tuple[Dict, List[str]]:
+        """Collect system stats and AI suggestions; runs on the thread pool."""
+        return self.ai_optimizer.get_system_stats(), self.ai_optimizer.get_ai_suggestions()
+        
+    def _on_system_sampled(self, sample: Tuple[Dict, List[str]]):
+        """Apply a finished system sample on the GUI thread."""
+        self._sample_in_flight = False
+        stats, suggestions = sample
+        self._adjust_refresh_interval(self._update_system_state(stats, suggestions))
+        
+    def _on_sample_failed(self, error: str):
+        """Record a failed system sample."""
+        self._sample_in_flight = False
+        logging.error(f"Error updating system state: {error}")
+        self._adjust_refresh_interval(False)
+        
+    def _adjust_refresh_interval(self, changed: bool):
+        """Back off the refresh timer while nothing is changing."""
+        interval = self.refresh_timer.interval()
+        if changed:
+            self._idle_ticks = 0
+            interval = _REFRESH_MIN_MS
+        else:
+            self._idle_ticks += 1
+            if self._idle_ticks >= _IDLE_TICKS_BEFORE_BACKOFF:
+                self._idle_ticks = 0
+                interval = min(interval * 2, _REFRESH_MAX_MS)
+        if interval != self.refresh_timer.interval():
+            self.refresh_timer.setInterval(interval)
+            
+    def _update_progress(self, bar: QProgressBar, value: int) -> bool:
+        """Set a progress bar only when the value moved past the hysteresis threshold."""
+        # An unset bar reads minimum - 1 (-1), so the first reading is always applied
+        current = bar.value()
+        if current >= bar.minimum() and abs(current - value) <= _CHANGE_THRESHOLD:
+            return False
+        bar.setValue(value)
+        return True
             
+    def _set_suggestions(self, lines: List[str]):
+        """Show AI suggestion lines, appending only the new ones when the list grew."""
+        lines = list(lines)
+        prev = self._prev_suggestions
+        if lines == prev:
+            return
+        if prev and lines[:len(prev)] == prev:
+            self.system_suggestions.appendPlainText("\n".join(lines[len(prev):]))
+        else:
+            self.system_suggestions.setPlainText("\n".join(lines))
+        self._prev_suggestions = lines
+            
+    def _update_system_state(self, stats: Dict, suggestions: List[str]) -> bool:
+        """Update system status displays from a sample and its AI suggestions.
+        
+        Returns True if any displayed value changed noticeably.
+        """
+        try:
             # Update progress bars
-            self.cpu_progress.setValue(int(stats['cpu_percent']))
-            self.memory_progress.setValue(int(stats['memory_percent']))
-            self.disk_progress.setValue(int(stats['disk_percent']))
+            changed = self._update_progress(self.cpu_progress, int(stats['cpu_percent']))
+            changed |= self._update_progress(self.memory_progress, int(stats['memory_percent']))
+            changed |= self._update_progress(self.disk_progress, int(stats['disk_percent']))
             
             if stats.get('battery_percent') is not None:
-                self.battery_progress.setValue(int(stats['battery_percent']))
+                changed |= self._update_progress(self.battery_progress, int(stats['battery_percent']))
                 self.battery_progress.setVisible(True)
                 self.battery_label.setVisible(True)
             else:
@@ -1633,20 +2108,22 @@ class AdaptiveMainWindow(QMainWindow):
                 
             # Update anomaly score
             anomaly_score = int(stats['anomaly_score'] * 100)  # Convert to percentage
-            self.anomaly_progress.setValue(anomaly_score)
+            changed |= self._update_progress(self.anomaly_progress, anomaly_score)
             
             # Update AI suggestions
-            suggestions = self.ai_optimizer.get_ai_suggestions()
-            self.system_suggestions.setText("\n".join(suggestions))
+            self._set_suggestions(suggestions)
+            
+            return changed
             
         except Exception as e:
             logging.error(f"Error updating system state: {str(e)}")
+            return False
             
     def _optimize_system(self):
         """Run AI-powered system optimization."""
         try:
             actions = self.ai_optimizer.optimize_system()
-            self.system_suggestions.setText("AI Optimization complete!\n\n" + "\n".join(actions))
+            self._set_suggestions(["AI Optimization complete!", ""] + list(actions))
         except Exception as e:
             logging.error(f"Error optimizing system: {str(e)}")
-            self.system_suggestions.setText(f"Error during optimization: {str(e)}")
+            self._set_suggestions([f"Error during optimization: {str(e)}"])
@@ -2,12 +2,42 @@
 Adaptive profile builder that creates personalized organization systems
 based on combinations of mental health considerations.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Flag, auto, Enum
-from typing import List, Dict, Set, Optional
+from typing import Any, List, Dict, Set, Optional
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+def _json_default(obj: Any) -> Any:
+    """Encode values that neither JSON backend handles natively."""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(obj, default=_json_default, indent=2 if indent else None).encode("utf-8")
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class MentalHealthFlags(Flag):
     """Flags for different mental health considerations."""
     NONE = 0
@@ -24,6 +54,7 @@ class Condition(Enum):
     DEPRESSION = "Depression"
     OCD = "OCD"
     PTSD = "PTSD"
+    BIPOLAR = "Bipolar Disorder"
 
 class TherapyType(Enum):
     """Types of therapy."""
@@ -62,6 +93,9 @@ class OrganizationPreference:
     backup_frequency: str
     reminder_frequency: str
 
+# Profile sections that rarely change once the profile is created
+_STATIC_PROFILE_FIELDS = ("name", "conditions", "therapy_types", "therapy_skills", "created_at")
+
 @dataclass
 class Profile:
     """User mental health profile."""
@@ -75,6 +109,12 @@ class Profile:
     updated_at: str
     notes: Optional[str] = None
 
+    def __setattr__(self, name: str, value: Any):
+        # Reassigning a static section invalidates its cached encoding
+        if name in _STATIC_PROFILE_FIELDS:
+            object.__setattr__(self, "_serialized_static", None)
+        object.__setattr__(self, name, value)
+
 class ProfileManager:
     """Builds and manages customized profiles based on mental health combinations."""
 
@@ -206,15 +246,27 @@ class ProfileManager:
     def _load_current_profile(self):
         """Load the current profile if it exists."""
         if self.current_profile_file.exists():
-            with open(self.current_profile_file, 'r') as f:
-                data = json.load(f)
-                self._current_profile = Profile(**data)
+            data = _loads(self.current_profile_file.read_bytes())
+            self._current_profile = Profile(**data)
 
     def _save_current_profile(self):
         """Save the current profile."""
         if self._current_profile:
-            with open(self.current_profile_file, 'w') as f:
-                json.dump(vars(self._current_profile), f, default=str)
+            self.current_profile_file.write_bytes(self._encode_profile(self._current_profile))
+
+    def _encode_profile(self, profile: Profile) -> bytes:
+        """Encode a profile, reusing the cached encoding of its static sections."""
+        static = getattr(profile, "_serialized_static", None)
+        if static is None:
+            static = _dumps({name: getattr(profile, name) for name in _STATIC_PROFILE_FIELDS})
+            object.__setattr__(profile, "_serialized_static", static)
+        dynamic = _dumps({
+            f.name: getattr(profile, f.name)
+            for f in fields(profile)
+            if f.name not in _STATIC_PROFILE_FIELDS
+        })
+        # Splice the two JSON objects into one so loading is unchanged
+        return static[:-1] + b"," + dynamic[1:]
 
     @property
     def current_profile(self) -> Optional[Profile]:
@@ -374,11 +426,8 @@ class ProfileManager:
     def save_profile(self, filepath: Path):
         """Save the current profile to a file."""
         profile = self.build_profile()
-        with open(filepath, 'w') as f:
-            json.dump(profile, f, indent=2)
+        Path(filepath).write_bytes(_dumps(profile, indent=True))
 
     def load_profile(self, filepath: Path):
         """Load a profile from a file."""
-        with open(filepath, 'r') as f:
-            profile = json.load(f)
-        return profile
+        return _loads(Path(filepath).read_bytes())
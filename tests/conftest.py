@@ -0,0 +1,11 @@
+import os
+
+import pytest
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication shared by every GUI test in the session."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
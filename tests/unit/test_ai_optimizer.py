@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import patch
+from src.core.ai_optimizer import AISystemOptimizer
+
+class TestAISystemOptimizer:
+    @pytest.fixture
+    def optimizer(self, tmp_path):
+        return AISystemOptimizer(tmp_path)
+        
+    def test_get_system_stats(self, optimizer):
+        stats = optimizer.get_system_stats()
+        for key in ('cpu_percent', 'memory_percent', 'disk_percent', 'battery_percent'):
+            assert key in stats
+        assert 0.0 <= stats['anomaly_score'] <= 1.0
+        
+    def test_anomaly_score_flags_spike(self, optimizer):
+        steady = {'cpu_percent': 10.0, 'memory_percent': 40.0}
+        for _ in range(10):
+            assert optimizer._anomaly_score(steady) == 0.0
+        spike = {'cpu_percent': 95.0, 'memory_percent': 40.0}
+        assert optimizer._anomaly_score(spike) == 1.0
+        
+    def test_get_ai_suggestions_uses_last_sample(self, optimizer):
+        busy = {'cpu_percent': 95.0, 'memory_percent': 20.0, 'disk_percent': 10.0,
+                'battery_percent': None}
+        with patch.object(optimizer, '_anomaly_score', return_value=0.0), \
+             patch('src.core.ai_optimizer.psutil.cpu_percent', return_value=busy['cpu_percent']):
+            optimizer.get_system_stats()
+        assert "High CPU usage detected. Consider:" in optimizer.get_ai_suggestions()
@@ -1,82 +1,72 @@
 import pytest
-from unittest.mock import patch, MagicMock
 from pathlib import Path
 import tempfile
 import shutil
+import sqlite3
 from src.core.smart_file_system.cli import main
-import sys
+
+def _write_test_files(directory):
+    (Path(directory) / "test1.txt").write_text("Machine learning document")
+    (Path(directory) / "test2.txt").write_text("Deep learning research")
+
+_TEST_DB_URI = "file:sfstest?mode=memory&cache=shared"
+
+@pytest.fixture(scope="module")
+def indexed_dir(tmp_path_factory):
+    # Index once per module; the embedding pass dominates each command's cost
+    d = tmp_path_factory.mktemp("idx")
+    _write_test_files(d)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SFS_DB_URI", _TEST_DB_URI)
+        # A shared in-memory DB lives only while a connection is open
+        keepalive = sqlite3.connect(_TEST_DB_URI, uri=True)
+        try:
+            main(["index", str(d)])
+            yield d
+        finally:
+            keepalive.close()
 
 class TestCLI:
     @pytest.fixture
     def test_dir(self):
         # Create temporary directory with test files
         temp_dir = tempfile.mkdtemp()
-        (Path(temp_dir) / "test1.txt").write_text("Machine learning document")
-        (Path(temp_dir) / "test2.txt").write_text("Deep learning research")
+        _write_test_files(temp_dir)
         yield temp_dir
         shutil.rmtree(temp_dir)
 
-    def test_index_command(self, test_dir, capsys):
-        test_args = ["cli.py", "index", test_dir]
-        with patch.object(sys, 'argv', test_args):
-            main()
+    def test_index_command(self, test_dir, tmp_path, capsys):
+        main(["index", test_dir, "--db", str(tmp_path / "file_index.db")])
             
         captured = capsys.readouterr()
         assert "Indexed 2 files" in captured.out
 
-    def test_cluster_command(self, test_dir, capsys):
-        # First index files
-        test_args = ["cli.py", "index", test_dir]
-        with patch.object(sys, 'argv', test_args):
-            main()
-            
-        # Then test clustering
-        test_args = ["cli.py", "cluster"]
-        with patch.object(sys, 'argv', test_args):
-            main()
+    def test_cluster_command(self, indexed_dir, capsys):
+        main(["cluster"])
             
         captured = capsys.readouterr()
         assert "clusters" in captured.out
 
-    def test_report_command(self, test_dir, capsys):
-        # Setup: index and cluster first
-        test_args = ["cli.py", "index", test_dir]
-        with patch.object(sys, 'argv', test_args):
-            main()
-            
-        test_args = ["cli.py", "cluster"]
-        with patch.object(sys, 'argv', test_args):
-            main()
+    def test_report_command(self, indexed_dir, capsys):
+        main(["cluster"])
             
         # Test report generation
         with tempfile.NamedTemporaryFile() as temp_file:
-            test_args = ["cli.py", "report", "--output", temp_file.name]
-            with patch.object(sys, 'argv', test_args):
-                main()
+            main(["report", "--output", temp_file.name])
                 
             captured = capsys.readouterr()
             assert temp_file.name in captured.out
             assert Path(temp_file.name).exists()
 
-    def test_search_command(self, test_dir, capsys):
-        # Setup: index files first
-        test_args = ["cli.py", "index", test_dir]
-        with patch.object(sys, 'argv', test_args):
-            main()
-            
-        # Test search
-        test_args = ["cli.py", "search", "machine learning"]
-        with patch.object(sys, 'argv', test_args):
-            main()
+    def test_search_command(self, indexed_dir, capsys):
+        main(["search", "machine learning"])
             
         captured = capsys.readouterr()
         assert "Similar files:" in captured.out
         assert "test1.txt" in captured.out
 
-    def test_error_handling(self, capsys):
-        test_args = ["cli.py", "index", "/nonexistent/directory"]
-        with patch.object(sys, 'argv', test_args):
-            main()
+    def test_error_handling(self, tmp_path, capsys):
+        main(["index", "/nonexistent/directory", "--db", str(tmp_path / "file_index.db")])
             
         captured = capsys.readouterr()
         assert "Error:" in captured.err
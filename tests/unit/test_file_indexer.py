@@ -0,0 +1,126 @@
+import pytest
+import numpy as np
+import sqlite3
+from unittest.mock import patch
+from src.core.smart_file_system import file_indexer
+from src.core.smart_file_system.file_indexer import FileIndexer
+
+# Bag-of-words embeddings over a fixed vocabulary; distinct weights make the
+# vectors non-integer so quantization actually has something to round
+_VOCAB = ("alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta")
+
+class _FakeModel:
+    def __init__(self, *args, **kwargs):
+        pass
+        
+    def encode(self, texts):
+        single = isinstance(texts, str)
+        vectors = np.zeros((1 if single else len(texts), len(_VOCAB)), dtype=np.float32)
+        for row, text in enumerate([texts] if single else texts):
+            for word in text.split():
+                if word in _VOCAB:
+                    index = _VOCAB.index(word)
+                    vectors[row, index] += 1.0 + index / 7
+        return vectors[0] if single else vectors
+
+class TestFileIndexer:
+    @pytest.fixture
+    def indexer(self, tmp_path):
+        with patch.object(file_indexer, "SentenceTransformer", _FakeModel):
+            return FileIndexer(db_path=str(tmp_path / "index.db"))
+            
+    @pytest.fixture
+    def docs(self, tmp_path):
+        contents = {
+            "exact.txt": "alpha beta gamma",
+            "close.txt": "alpha beta delta",
+            "partial.txt": "alpha epsilon zeta",
+            "unrelated.txt": "eta theta",
+        }
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        for name, text in contents.items():
+            (docs_dir / name).write_text(text)
+        return docs_dir
+        
+    def test_index_files(self, indexer, docs):
+        assert indexer.index_files(sorted(docs.iterdir())) == 4
+        
+    def test_bad_row_only_skips_that_file(self, indexer, docs):
+        # Reject one path at the database level so the batched insert fails
+        with sqlite3.connect(indexer.db_path) as conn:
+            conn.execute('''
+                CREATE TRIGGER reject_close BEFORE INSERT ON files
+                WHEN NEW.path LIKE '%close.txt'
+                BEGIN SELECT RAISE(ABORT, 'rejected'); END
+            ''')
+            
+        assert indexer.index_files(sorted(docs.iterdir())) == 3
+        assert indexer.get_file_embedding(str(docs / "exact.txt")) is not None
+        assert indexer.get_file_embedding(str(docs / "close.txt")) is None
+        
+    def test_unreadable_file_is_skipped(self, indexer, docs):
+        (docs / "broken.txt").write_bytes(b"\xff\xfe\xfa")
+        assert indexer.index_files(sorted(docs.iterdir())) == 4
+        
+    def test_quantize_round_trip(self):
+        embeddings = _FakeModel().encode(["alpha beta gamma", "delta theta theta", "eta"])
+        quantized, scales = FileIndexer._quantize_embeddings(embeddings)
+        assert quantized.dtype == np.int8
+        
+        decoded = FileIndexer.decode_embeddings([q.tobytes() for q in quantized], scales)
+        # Rounding to the nearest step is off by at most half a step per element
+        assert np.all(np.abs(decoded - embeddings) <= scales[:, None] / 2 + 1e-6)
+        
+    def test_quantized_search_matches_float_ranking(self, indexer, docs):
+        paths = sorted(docs.iterdir())
+        indexer.index_files(paths)
+        query = "alpha beta gamma"
+        
+        # Rank with the unquantized float vectors for reference
+        model = _FakeModel()
+        matrix = model.encode([p.read_text() for p in paths])
+        q = model.encode(query)
+        float_scores = matrix @ q / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(q))
+        expected = [str(paths[i]) for i in np.argsort(-float_scores)[:3]]
+        
+        results = indexer.search_similar_files(query, top_k=3)
+        assert [r['path'] for r in results] == expected
+        
+    def test_migrates_float_embeddings_once(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        legacy = np.array([0.5, -1.0, 0.25], dtype=np.float32)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute('CREATE TABLE files (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                         'path TEXT UNIQUE, file_hash TEXT, last_modified REAL, size INTEGER, '
+                         'file_type TEXT, metadata TEXT, embedding BLOB)')
+            conn.execute('INSERT INTO files (path, embedding) VALUES (?, ?)',
+                         ("old.txt", legacy.tobytes()))
+            
+        with patch.object(file_indexer, "SentenceTransformer", _FakeModel):
+            indexer = FileIndexer(db_path=str(db_path))
+            
+        decoded = indexer.get_file_embedding("old.txt")
+        assert np.allclose(decoded, legacy, atol=1.0 / 127)
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute('PRAGMA user_version').fetchone()[0] == 1
+            
+        # A second open must not re-quantize the already int8 blob
+        with patch.object(file_indexer, "SentenceTransformer", _FakeModel):
+            FileIndexer(db_path=str(db_path))
+        assert np.array_equal(indexer.get_file_embedding("old.txt"), decoded)
+        
+    def test_encode_failure_only_skips_its_chunk(self, indexer, docs):
+        encode = indexer.embedding_model.encode
+        
+        def failing_encode(texts):
+            if any("theta" in text for text in texts):
+                raise RuntimeError("model failure")
+            return encode(texts)
+            
+        # Sorted docs chunk as [close, exact] and [partial, unrelated]
+        with patch.object(file_indexer, "_INDEX_CHUNK_SIZE", 2), \
+             patch.object(indexer.embedding_model, "encode", side_effect=failing_encode):
+            assert indexer.index_files(sorted(docs.iterdir())) == 2
+        assert indexer.get_file_embedding(str(docs / "close.txt")) is not None
+        assert indexer.get_file_embedding(str(docs / "unrelated.txt")) is None
@@ -0,0 +1,27 @@
+import pytest
+from pathlib import Path
+from src.core.file_organizer import FileOrganizer
+
+class TestFileOrganizer:
+    @pytest.fixture
+    def organizer(self, tmp_path):
+        return FileOrganizer(tmp_path)
+        
+    def test_setup_folder_structure(self, organizer, tmp_path):
+        structure = organizer.setup_folder_structure()
+        
+        assert set(structure) == set(organizer.config['categories'])
+        for category, folder in structure.items():
+            assert folder == tmp_path / "organized" / category
+            assert folder.is_dir()
+            
+    def test_setup_folder_structure_is_idempotent(self, organizer, tmp_path):
+        root = tmp_path / "files"
+        organizer.setup_folder_structure(root)
+        assert organizer.setup_folder_structure(root) == {
+            category: root / category for category in organizer.config['categories']
+        }
+        
+    def test_categorize_files(self, organizer):
+        results = organizer.categorize_files([Path("a.PDF"), Path("b.py"), Path("c.xyz")])
+        assert results == {Path("a.PDF"): 'documents', Path("b.py"): 'code', Path("c.xyz"): None}
@@ -0,0 +1,120 @@
+import pytest
+import errno
+import os
+from pathlib import Path
+from unittest.mock import patch
+from src.file_organization.organization_strategies import (
+    FileOrganizer, MentalHealthProfile, OrganizationStrategy
+)
+
+class TestFileOrganizer:
+    @pytest.fixture
+    def organizer(self, tmp_path):
+        # ADHD alone selects the MINIMAL strategy
+        profile = MentalHealthProfile()
+        profile.has_adhd = True
+        organizer = FileOrganizer(profile)
+        organizer.base_path = tmp_path / "organized"
+        return organizer
+        
+    def test_minimal_strategy(self, organizer):
+        assert organizer.strategy == OrganizationStrategy.MINIMAL
+        
+    def test_base_path_change_moves_targets(self, organizer, tmp_path):
+        new_root = tmp_path / "elsewhere"
+        organizer.base_path = new_root
+        
+        suggested = organizer.suggest_file_location(Path("notes.md"))
+        assert suggested == new_root / "NOW - Current Projects" / "notes.md"
+        
+    def test_reference_file_suffixes(self, organizer):
+        assert organizer._is_reference_file("report.pdf")
+        assert not organizer._is_reference_file(".md")
+        assert not organizer._is_reference_file("script.py")
+        
+    def test_organize_directory_moves_files(self, organizer, tmp_path):
+        source = tmp_path / "inbox"
+        (source / "nested").mkdir(parents=True)
+        (source / "a.txt").write_text("a")
+        (source / "nested" / "b.txt").write_text("b")
+        
+        organizer.organize_directory(source)
+        
+        target = organizer.base_path / "NOW - Current Projects"
+        assert (target / "a.txt").read_text() == "a"
+        assert (target / "b.txt").read_text() == "b"
+        assert not (source / "a.txt").exists()
+        
+    def test_organize_directory_keeps_duplicate_names(self, organizer, tmp_path):
+        source = tmp_path / "inbox"
+        for sub in ("one", "two"):
+            (source / sub).mkdir(parents=True)
+            (source / sub / "notes.txt").write_text(sub)
+            
+        organizer.organize_directory(source)
+        
+        # Sorted planning gives the plain name to the first source path
+        target = organizer.base_path / "NOW - Current Projects"
+        assert (target / "notes.txt").read_text() == "one"
+        assert (target / "notes (1).txt").read_text() == "two"
+        
+    def test_move_file_across_devices(self, organizer, tmp_path):
+        src = tmp_path / "src.txt"
+        dst = tmp_path / "dst.txt"
+        src.write_text("payload")
+        
+        with patch("os.rename", side_effect=OSError(errno.EXDEV, "cross-device")):
+            organizer._move_file(str(src), str(dst))
+            
+        assert dst.read_text() == "payload"
+        assert not src.exists()
+        
+    def test_move_file_reraises_other_errors(self, organizer, tmp_path):
+        src = tmp_path / "src.txt"
+        src.write_text("payload")
+        
+        with patch("os.rename", side_effect=OSError(errno.EACCES, "denied")):
+            with pytest.raises(OSError):
+                organizer._move_file(str(src), str(tmp_path / "dst.txt"))
+        assert src.exists()
+        
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"),
+                        reason="copy_file_range not available")
+    def test_copy_across_devices_falls_back(self, organizer, tmp_path):
+        src = tmp_path / "src.txt"
+        dst = tmp_path / "dst.txt"
+        src.write_text("payload")
+        
+        with patch("os.copy_file_range", side_effect=OSError(errno.EXDEV, "cross-device")):
+            organizer._copy_across_devices(str(src), str(dst))
+            
+        assert dst.read_text() == "payload"
+        
+    def test_organize_directory_keeps_existing_destination(self, organizer, tmp_path):
+        target = organizer.base_path / "NOW - Current Projects"
+        target.mkdir(parents=True)
+        (target / "notes.txt").write_text("existing")
+        source = tmp_path / "inbox"
+        source.mkdir()
+        (source / "notes.txt").write_text("incoming")
+        
+        organizer.organize_directory(source)
+        
+        assert (target / "notes.txt").read_text() == "existing"
+        assert (target / "notes (1).txt").read_text() == "incoming"
+        
+    def test_organize_directory_with_base_path_inside(self, organizer, tmp_path):
+        # Organizing the tree that also holds the targets
+        organizer.base_path = tmp_path
+        target = tmp_path / "NOW - Current Projects"
+        target.mkdir()
+        (target / "notes.txt").write_text("placed")
+        (tmp_path / "inbox").mkdir()
+        (tmp_path / "inbox" / "notes.txt").write_text("incoming")
+        
+        organizer.organize_directory(tmp_path)
+        
+        # The already-placed file stays put; the newcomer gets a free name
+        assert (target / "notes.txt").read_text() == "placed"
+        assert (target / "notes (1).txt").read_text() == "incoming"
+        assert not (tmp_path / "inbox" / "notes.txt").exists()